@@ -39,6 +39,7 @@ from .pdf_parser import (
 from .utils import (
     validate_pdf_file,
     get_file_info,
+    count_pdf_pages,
     clean_text,
     console,
     save_json_result
@@ -71,6 +72,7 @@ __all__ = [
     "create_results_directory",
     "validate_pdf_file",
     "get_file_info",
+    "count_pdf_pages",
     "clean_text",
     "save_json_result",
     "console"
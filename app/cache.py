@@ -0,0 +1,130 @@
+"""
+Business Settlement PDF 분석 시스템 - 캐시
+
+파일 내용 해시를 키로 사용하는 디스크 캐시를 제공합니다.
+- 동일한 PDF에 대한 유료 Upstage API 호출 재사용
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+# 캐시 루트 디렉토리 (SMARTEXPENSE_CACHE_DIR 환경변수로 변경 가능)
+DEFAULT_CACHE_DIR = Path(
+    os.getenv("SMARTEXPENSE_CACHE_DIR") or Path.home() / ".cache" / "smartexpense"
+)
+
+# 최대 항목 수 정리 간격 (초, 쓰기마다 디렉토리를 훑지 않도록 제한)
+_PRUNE_INTERVAL_SECONDS = 60.0
+
+
+def hash_bytes(data: bytes) -> str:
+    """
+    파일 내용 해시 (SHA-256)
+
+    Args:
+        data: 파일 내용
+
+    Returns:
+        16진수 해시 문자열
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+class DiskCache:
+    """
+    네임스페이스별 디스크 캐시
+
+    키 하나를 파일 하나로 저장하며, 파일 수정 시각으로 만료 여부를 판단합니다.
+    만료된 항목은 읽기 시점과 주기적인 쓰기 시점 정리에서 삭제하고,
+    최대 항목 수를 넘으면 오래된 항목부터 삭제합니다.
+    캐시 읽기/쓰기 실패는 처리 흐름에 영향을 주지 않도록 조용히 무시합니다.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        directory: Optional[str] = None,
+        expire_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None
+    ):
+        """
+        Args:
+            namespace: 캐시 이름 (기본 디렉토리 하위 폴더명)
+            directory: 캐시 디렉토리 (기본: DEFAULT_CACHE_DIR / namespace)
+            expire_seconds: 만료 시간 (초, None이면 만료 없음)
+            max_entries: 최대 항목 수 (None이면 제한 없음)
+        """
+        self.directory = Path(directory) if directory else DEFAULT_CACHE_DIR / namespace
+        self.expire_seconds = expire_seconds
+        self.max_entries = max_entries
+
+        # 마지막 정리 시각 (time.monotonic 기준, None이면 아직 정리 전)
+        self._last_prune: Optional[float] = None
+
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시된 값 조회 (없거나 만료되면 None)"""
+
+        path = self.directory / key
+
+        try:
+            if self.expire_seconds is not None:
+                if time.time() - path.stat().st_mtime > self.expire_seconds:
+                    path.unlink(missing_ok=True)
+                    return None
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def set(self, key: str, value: bytes) -> None:
+        """값 저장 (임시 파일에 쓴 뒤 교체하여 부분 쓰기 방지)"""
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(value)
+                os.replace(tmp_path, self.directory / key)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+            now = time.monotonic()
+            if self._last_prune is None or now - self._last_prune >= _PRUNE_INTERVAL_SECONDS:
+                self._last_prune = now
+                self._prune()
+        except OSError:
+            pass
+
+    def _prune(self) -> None:
+        """만료된 항목 삭제 후, 최대 항목 수를 넘으면 수정 시각이 오래된 항목부터 삭제"""
+
+        if self.expire_seconds is None and self.max_entries is None:
+            return
+
+        now = time.time()
+        entries = []
+        for path in self.directory.iterdir():
+            # 다른 쓰기가 진행 중인 임시 파일은 건드리지 않음
+            if path.suffix == ".tmp":
+                continue
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+
+            # 다시 읽히지 않는 만료 항목도 디스크에 남지 않도록 삭제
+            if self.expire_seconds is not None and now - mtime > self.expire_seconds:
+                path.unlink(missing_ok=True)
+                continue
+            entries.append((mtime, path))
+
+        if self.max_entries is not None and len(entries) > self.max_entries:
+            entries.sort(key=lambda entry: entry[0])
+            for _, path in entries[:len(entries) - self.max_entries]:
+                path.unlink(missing_ok=True)
@@ -193,6 +193,11 @@ class DocumentDetection(BaseModel):
         default_factory=dict,
         description="추출된 구조화 데이터"
     )
+    text_spans: List[tuple[int, int]] = Field(
+        default_factory=list,
+        exclude=True,  # 전체 텍스트 없이는 의미가 없으므로 JSON 저장 시 제외
+        description="PDFProcessingResult.extracted_text 내 문서 페이지별 텍스트 위치 [(시작, 끝 문자 오프셋), ...]"
+    )
 
 
 class PDFProcessingResult(BaseModel):
@@ -228,6 +233,13 @@ class PDFProcessingResult(BaseModel):
         description="처리 시간 (초)"
     )
     
+    # 추출된 전체 텍스트 (감지된 문서들이 text_spans로 공유, 문서별 원문은 raw_text로 저장되므로 JSON 저장 시 제외)
+    extracted_text: str = Field(
+        default="",
+        exclude=True,
+        description="추출된 전체 텍스트"
+    )
+    
     # 문서 감지 결과
     detected_documents: List[DocumentDetection] = Field(
         default_factory=list,
@@ -272,6 +284,10 @@ class PDFProcessingResult(BaseModel):
         """경고 메시지 추가"""
         self.warnings.append(f"[{datetime.now().isoformat()}] {warning_message}")
     
+    def get_document_text(self, detection: DocumentDetection) -> str:
+        """감지된 문서의 텍스트 반환 (전체 추출 텍스트에서 페이지별 구간을 잘라 결합, 페이지 구분자 제외)"""
+        return "\n\n".join(self.extracted_text[start:end] for start, end in detection.text_spans)
+    
     def get_extraction_summary(self) -> Dict[str, Any]:
         """추출 요약 정보 반환"""
         total_documents = len(self.detected_documents)
@@ -8,23 +8,38 @@ PDF 파싱 및 텍스트 추출 엔진
 """
 
 import asyncio
+import hashlib
+import importlib
+import io
+import multiprocessing
 import os
 import re
-from datetime import datetime
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet, Container, NamedTuple
 import logging
 
 # PDF 처리 라이브러리들
+# (pdfplumber, pytesseract, OpenCV는 폴백 경로에서만 쓰이므로 _lazy_import로 지연 로드)
 import fitz  # PyMuPDF
-import pdfplumber
 from PIL import Image
-import pytesseract
-from pdf2image import convert_from_path
 
-# HTTP 클라이언트
-import requests
-import json
+# 다중 키워드 매칭 (Aho-Corasick, 미설치 시 정규식 합집합으로 대체)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# HTTP 클라이언트 + 고속 JSON 파서 (대용량 Upstage 응답)
+import httpx
+import orjson
 
 # 프로젝트 모듈
 from .models import (
@@ -35,11 +50,257 @@ from .models import (
     DocumentDetection
 )
 from .utils import validate_pdf_file, get_file_info, clean_text
+from .cache import DiskCache, hash_bytes
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upstage 응답 캐시 보관 기간 (30일)
+_UPSTAGE_CACHE_EXPIRE_SECONDS = 30 * 24 * 60 * 60
+_UPSTAGE_CACHE_MAX_ENTRIES = 1000
+
+# 로컬 엔진 추출 텍스트 디스크 캐시 만료 시간 (초) 및 최대 항목 수
+_TEXT_CACHE_EXPIRE_SECONDS = 30 * 24 * 60 * 60
+_TEXT_CACHE_MAX_ENTRIES = 1000
+
+# 엔진 결과 채택 최소 텍스트 길이 (Upstage는 더 관대하게)
+_MIN_TEXT_LENGTH = 50
+_UPSTAGE_MIN_TEXT_LENGTH = 20
+
+# 페이지 단위 OCR 병렬 처리 워커 수 (4~6개 이상에서는 효과가 거의 없음)
+_OCR_MAX_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Upstage API 재시도 설정 (일시적 게이트웨이 오류만 재시도)
+_UPSTAGE_MAX_RETRIES = 3
+_UPSTAGE_RETRY_BACKOFF_SECONDS = 0.3
+_UPSTAGE_RETRY_STATUS_CODES = frozenset({502, 503, 504})
+
+# Upstage API 동시 요청 수 (엔진 인스턴스 단위, API 속도 제한 초과 방지)
+_UPSTAGE_MAX_CONCURRENCY = 8
+
+# Upstage API 타임아웃 (문서 파싱은 다중 페이지 OCR로 오래 걸릴 수 있으나, 연결 실패는 빨리 감지)
+_UPSTAGE_TIMEOUT_SECONDS = 120.0
+_UPSTAGE_CONNECT_TIMEOUT_SECONDS = 10.0
+
+# OCR용 페이지 렌더링 배율 (kor+eng 인식률 기준 2배, 낮출 경우 실측 후 조정)
+_OCR_RENDER_ZOOM = 2
+_OCR_RENDER_MATRIX = fitz.Matrix(_OCR_RENDER_ZOOM, _OCR_RENDER_ZOOM)
+
+# 텍스트 PDF 사전 판별 기준 (첫 페이지 글자 수 / 면적(pt²), A4 기준 약 250자)
+_TEXT_PROBE_MIN_DENSITY = 0.0005
+
+# 이미지가 페이지 면적의 이 비율 이상을 덮으면 스캔 문서로 간주
+_TEXT_PROBE_MAX_IMAGE_COVERAGE = 0.5
+
+# 텍스트가 부족한 페이지라도 이미지가 이 비율 미만이면 빈 페이지로 보고 OCR 생략
+_OCR_MIN_IMAGE_COVERAGE = 0.4
+
+# 페이지 타입 감지 결과 캐시 크기 (감지기 인스턴스 단위)
+_PAGE_CACHE_SIZE = 4096
+
+# 지연 로드된 모듈 (모듈명 -> 모듈)
+_lazy_modules: Dict[str, Any] = {}
+
+
+def _lazy_import(name: str) -> Any:
+    """무거운 모듈을 첫 사용 시점에 한 번만 import"""
+    
+    module = _lazy_modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+        _lazy_modules[name] = module
+    return module
+
+
+@lru_cache(maxsize=None)
+def _get_opencv() -> Optional[Tuple[Any, Any, Any]]:
+    """
+    OCR 전처리용 OpenCV 로드 (선택적 의존성)
+    
+    Returns:
+        (cv2, numpy, 선명도_커널) 또는 미설치 시 None
+    """
+    try:
+        cv2 = _lazy_import("cv2")
+        np = _lazy_import("numpy")
+    except ImportError:
+        return None
+    
+    # PIL ImageEnhance.Sharpness(1.2)와 같은 가중치의 커널: 1.2·원본 - 0.2·SMOOTH
+    sharpen_kernel = (
+        1.2 * np.array([[0, 0, 0], [0, 1, 0], [0, 0, 0]], dtype=np.float32)
+        - 0.2 * np.array([[1, 1, 1], [1, 5, 1], [1, 1, 1]], dtype=np.float32) / 13
+    )
+    return cv2, np, sharpen_kernel
+
+
+def _page_image_coverage(page: "fitz.Page") -> float:
+    """페이지 면적 대비 이미지가 차지하는 비율 (0~1)"""
+    
+    page_area = max(1.0, page.rect.width * page.rect.height)
+    image_area = sum(
+        fitz.Rect(info["bbox"]).get_area()
+        for info in page.get_image_info()
+    )
+    return min(1.0, image_area / page_area)
+
+
+def _pymupdf_text_pass(pdf_bytes: bytes) -> Tuple[List[str], List[int], int]:
+    """
+    PyMuPDF 일반 텍스트 추출 및 OCR 대상 페이지 선별 (스레드에서 실행)
+    
+    Returns:
+        (페이지별 텍스트, OCR 대상 페이지 번호, OCR을 생략한 빈 페이지 수)
+    """
+    
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    
+    try:
+        if len(doc) == 0:
+            raise ValueError("PDF에 페이지가 없습니다")
+        
+        page_texts = []
+        ocr_pages = []
+        blank_pages = 0
+        
+        for page_num, page in enumerate(doc):
+            text = page.get_text()
+            page_texts.append(text)
+            
+            # 텍스트가 없거나 매우 적은 페이지 중 이미지로 덮인(스캔) 페이지만 OCR 대상
+            if not text or len(text.strip()) < 50:
+                if _page_image_coverage(page) >= _OCR_MIN_IMAGE_COVERAGE:
+                    ocr_pages.append(page_num)
+                else:
+                    blank_pages += 1
+        
+        return page_texts, ocr_pages, blank_pages
+    finally:
+        doc.close()
+
+
+def _pymupdf_ocr_page_worker(pdf_bytes: bytes, page_nums: List[int]) -> List[Tuple[int, str, Optional[str]]]:
+    """
+    PyMuPDF 렌더링 + Tesseract OCR 페이지 워커 (프로세스 풀에서 실행)
+    
+    fitz.Document는 pickle할 수 없고 스레드 간 공유도 안전하지 않으므로
+    워커마다 메모리의 PDF 바이트로 문서를 직접 엽니다.
+    PDF 바이트 전달 비용을 줄이기 위해 여러 페이지를 한 번에 처리하되,
+    오류는 페이지 단위로 처리하여 한 페이지 실패가 나머지 페이지에 영향을 주지 않습니다.
+    
+    Returns:
+        [(페이지_번호, OCR_텍스트, 오류_메시지_또는_None), ...]
+    """
+    pytesseract = _lazy_import("pytesseract")
+    
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        results = []
+        
+        for page_num in page_nums:
+            try:
+                page = doc.load_page(page_num)
+                
+                # 페이지를 이미지로 렌더링 (알파 채널 없이 RGB)
+                pix = page.get_pixmap(matrix=_OCR_RENDER_MATRIX, alpha=False)
+                
+                # PNG 인코딩/디코딩 없이 원시 픽셀 버퍼를 그대로 PIL 이미지로 변환
+                img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+                
+                results.append((page_num, pytesseract.image_to_string(
+                    img,
+                    lang='kor+eng',
+                    config='--psm 6',
+                    output_type=pytesseract.Output.STRING
+                ), None))
+            except Exception as e:
+                # 예외 객체는 pickle되지 않을 수 있으므로 메시지만 전달
+                results.append((page_num, "", str(e)))
+        
+        return results
+    finally:
+        doc.close()
+
+
+# 테이블 행 직렬화 (셀 구분자 " | ")
+_fmt_row = " | ".join
+
+
+def _pdfplumber_extract(pdf_bytes: bytes) -> List[str]:
+    """
+    pdfplumber 페이지 텍스트 + 테이블 추출 (스레드에서 실행)
+    
+    Returns:
+        페이지 순서대로 정렬된 텍스트 조각 리스트
+    """
+    pdfplumber = _lazy_import("pdfplumber")
+    
+    text_parts = []
+    
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            
+            if not text or not text.strip():
+                continue
+            
+            text_parts.append(f"--- 페이지 {page_num + 1} ---\n{text}")
+            
+            # 테이블도 추출 시도
+            tables = page.extract_tables()
+            for table_idx, table in enumerate(tables):
+                if table:
+                    table_text = "\n".join(
+                        _fmt_row(cell or "" for cell in row)
+                        for row in table
+                    )
+                    text_parts.append(f"[테이블 {table_idx + 1}]\n{table_text}")
+    
+    return text_parts
+
+
+def _tesseract_pages_worker(pdf_bytes: bytes, offset: int, stride: int) -> List[Tuple[int, str, Optional[str]]]:
+    """
+    PyMuPDF 300 DPI 렌더링 + 이미지 전처리 + Tesseract OCR 워커 (프로세스 풀에서 실행)
+    
+    Poppler 서브프로세스나 임시 이미지 파일 없이 워커 안에서 직접 렌더링합니다.
+    offset 페이지부터 stride 간격의 페이지들을 처리하고, 한 번에 한 페이지 이미지만 메모리에 유지합니다.
+    
+    Returns:
+        [(페이지_번호, OCR_텍스트, 오류_메시지_또는_None), ...]
+    """
+    pytesseract = _lazy_import("pytesseract")
+    
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        results = []
+        
+        for page_num in range(offset, len(doc), stride):
+            try:
+                # 페이지를 고해상도 그레이스케일 이미지로 렌더링 (원시 픽셀 버퍼 → PIL 이미지)
+                # 전처리가 그레이스케일로 시작하므로 RGB 렌더링 + 변환 단계를 생략 (픽셀 버퍼 1/3)
+                pix = doc.load_page(page_num).get_pixmap(dpi=300, colorspace=fitz.csGRAY, alpha=False)
+                image = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+                
+                # 이미지 전처리 (OCR 정확도 향상)
+                processed_image = PDFParsingEngine._preprocess_image_for_ocr(image)
+                
+                # OCR 실행 (한국어 + 영어)
+                results.append((page_num, pytesseract.image_to_string(
+                    processed_image,
+                    lang='kor+eng',  # 한국어 + 영어
+                    config='--psm 6',  # 블록 단위 OCR
+                    output_type=pytesseract.Output.STRING
+                ), None))
+            except Exception as e:
+                # 예외 객체는 pickle되지 않을 수 있으므로 메시지만 전달
+                results.append((page_num, "", str(e)))
+        
+        return results
+    finally:
+        doc.close()
+
 
 class PDFParsingEngine:
     """
@@ -52,28 +313,135 @@ class PDFParsingEngine:
     4. 🔧 Tesseract OCR (최후 수단)
     """
     
-    def __init__(self, upstage_api_key: str = None, verbose: bool = False):
+    def __init__(
+        self, 
+        upstage_api_key: str = None, 
+        verbose: bool = False,
+        text_probe: bool = True,
+        disk_cache: bool = False
+    ):
         """
         Args:
             upstage_api_key: Upstage API 키
             verbose: 상세 로그 출력 여부
+            text_probe: Upstage 선호 시 텍스트 PDF를 사전 판별하여 PyMuPDF를 먼저 시도할지 여부
+            disk_cache: Upstage 응답 및 로컬 엔진(PyMuPDF, pdfplumber, Tesseract) 추출 결과 디스크 캐시 사용 여부
         """
         self.verbose = verbose
         self.upstage_api_key = upstage_api_key or os.getenv('UPSTAGE_API_KEY')
+        self.text_probe = text_probe
         
-        # 엔진별 통계
-        self.engine_stats = {
-            engine: {"success": 0, "failure": 0, "total_time": 0.0}
-            for engine in ExtractionEngine
-        }
+        # 엔진별 통계 ((엔진, 항목) 키 하나로 갱신: success, failure, total_time_ns, cache_hits, hedge_wins)
+        self.engine_stats: Counter = Counter()
+        
+        # 텍스트 PDF 사전 판별 통계
+        self.probe_stats = {"probes": 0, "hits": 0}
+        
+        # Upstage 원본 응답 캐시 (파일 해시 기준, 유료 API 재호출 방지)
+        # 디스크 캐시는 문서 내용이 디스크에 남으므로 disk_cache=True로 켠 경우에만 사용
+        self.upstage_cache: Optional[DiskCache] = DiskCache(
+            "upstage",
+            expire_seconds=_UPSTAGE_CACHE_EXPIRE_SECONDS,
+            max_entries=_UPSTAGE_CACHE_MAX_ENTRIES
+        ) if disk_cache else None
+        
+        # 로컬 엔진 추출 텍스트 캐시 (파일 해시 + 엔진 기준, 동일 PDF 재처리 시 OCR 생략)
+        self.text_cache: Optional[DiskCache] = DiskCache(
+            "pdf_text",
+            expire_seconds=_TEXT_CACHE_EXPIRE_SECONDS,
+            max_entries=_TEXT_CACHE_MAX_ENTRIES
+        ) if disk_cache else None
+        
+        # OCR용 프로세스 풀 (첫 사용 시 생성 후 재사용)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        
+        # Upstage API용 비동기 HTTP 클라이언트 (첫 사용 시 생성 후 재사용)
+        self._http: Optional[httpx.AsyncClient] = None
+        
+        # Upstage API 동시 요청 제한 (여러 PDF를 동시에 처리해도 API 속도 제한 안에서 대기)
+        self._upstage_semaphore = asyncio.Semaphore(_UPSTAGE_MAX_CONCURRENCY)
         
         if self.verbose:
             logger.info("🚀 PDF 파싱 엔진 초기화 완료")
     
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """OCR용 프로세스 풀 반환 (호출마다 재생성하지 않도록 캐시)"""
+        
+        if self._pool is None:
+            # 이미 스레드(asyncio.to_thread, Rich 갱신 스레드)가 떠 있는 프로세스에서 fork하면
+            # 잠금 상태가 복제되어 교착될 수 있으므로 spawn으로 워커 생성
+            self._pool = ProcessPoolExecutor(
+                max_workers=_OCR_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+    
+    async def _run_in_pool(self, func: Any, *args: Any) -> Any:
+        """OCR 프로세스 풀에서 함수 실행 (워커가 비정상 종료되면 풀을 폐기하여 다음 호출 시 재생성)"""
+        
+        pool = self._get_process_pool()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            # 동시에 실패한 다른 호출이 이미 새 풀을 만들었으면 그대로 둠
+            if self._pool is pool:
+                self._pool = None
+                pool.shutdown(wait=False, cancel_futures=True)
+            raise
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Upstage API용 비동기 HTTP 클라이언트 반환"""
+        
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=httpx.Timeout(_UPSTAGE_TIMEOUT_SECONDS, connect=_UPSTAGE_CONNECT_TIMEOUT_SECONDS),
+                # 연결 수립 실패 시 재시도 (keep-alive 연결 재사용으로 PDF마다 TLS 핸드셰이크 생략)
+                # transport를 직접 지정하면 클라이언트의 limits는 무시되므로 연결 풀 제한도 transport에 설정
+                transport=httpx.AsyncHTTPTransport(
+                    retries=_UPSTAGE_MAX_RETRIES,
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+                )
+            )
+        return self._http
+    
+    async def _post_upstage(self, url: str, **kwargs) -> httpx.Response:
+        """Upstage API POST 요청 (502/503/504 응답은 지수 백오프로 재시도)"""
+        
+        client = self._get_http_client()
+        
+        for attempt in range(_UPSTAGE_MAX_RETRIES + 1):
+            # 재시도 대기 중에는 슬롯을 반환하여 다른 요청이 진행되도록 요청 단위로만 점유
+            async with self._upstage_semaphore:
+                response = await client.post(url, **kwargs)
+            
+            if response.status_code not in _UPSTAGE_RETRY_STATUS_CODES or attempt == _UPSTAGE_MAX_RETRIES:
+                return response
+            
+            if self.verbose:
+                logger.warning(f"🚀 Upstage 일시 오류 {response.status_code}, 재시도 {attempt + 1}/{_UPSTAGE_MAX_RETRIES}")
+            await asyncio.sleep(_UPSTAGE_RETRY_BACKOFF_SECONDS * (2 ** attempt))
+        
+        return response
+    
+    async def aclose(self) -> None:
+        """엔진 리소스 정리 (HTTP 클라이언트, OCR 프로세스 풀 종료)"""
+        
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        
+        if self._pool is not None:
+            await asyncio.to_thread(self._pool.shutdown, True)
+            self._pool = None
+    
     async def extract_text_from_pdf(
         self, 
         file_path: str, 
-        preferred_engine: ExtractionEngine = ExtractionEngine.UPSTAGE
+        preferred_engine: ExtractionEngine = ExtractionEngine.UPSTAGE,
+        hedged: bool = False,
+        validation_result: Optional[Dict[str, Any]] = None,
+        pdf_bytes: Optional[bytes] = None,
+        pdf_digest: Optional[str] = None
     ) -> Tuple[str, ExtractionEngine, float]:
         """
         PDF 파일에서 텍스트 추출 (자동 폴백 지원)
@@ -81,52 +449,80 @@ class PDFParsingEngine:
         Args:
             file_path: PDF 파일 경로
             preferred_engine: 선호하는 추출 엔진
+            hedged: Upstage와 PyMuPDF를 동시에 실행하여 먼저 성공한 결과 사용
+                    (지연 시간 단축, 대신 Upstage 호출 비용이 항상 발생)
+            validation_result: 호출자가 미리 수행한 validate_pdf_file 결과 (있으면 재검증 생략)
+            pdf_bytes: 호출자가 이미 읽은 PDF 내용 (있으면 파일을 다시 읽지 않음)
+            pdf_digest: pdf_bytes의 hash_bytes 결과 (있으면 캐시 키 계산 시 재해시 생략)
             
         Returns:
             (추출된_텍스트, 사용된_엔진, 처리_시간)
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         # PDF 파일 검증
-        validation_result = validate_pdf_file(file_path)
+        if validation_result is None:
+            # 구조 오류는 추출 엔진이 어차피 감지하므로 헤더/트레일러만 확인하는 가벼운 검증 사용
+            validation_result = validate_pdf_file(file_path, deep=False)
         if not validation_result["is_valid"]:
             raise ValueError(f"PDF 파일 검증 실패: {validation_result['error']}")
         
         if self.verbose:
             logger.info(f"📄 PDF 파싱 시작: {Path(file_path).name}")
         
+        # PDF를 한 번만 읽어 모든 엔진에서 재사용 (폴백 시 디스크 재읽기 방지)
+        if pdf_bytes is None:
+            pdf_bytes = await asyncio.to_thread(Path(file_path).read_bytes)
+        
+        # 캐시 키용 해시도 한 번만 계산하여 모든 엔진이 공유
+        if pdf_digest is None:
+            pdf_digest = await asyncio.to_thread(hash_bytes, pdf_bytes)
+        
+        # 텍스트 PDF면 PyMuPDF로 충분하므로 Upstage API 호출 전에 먼저 시도
+        is_text_pdf = False
+        if self.text_probe and preferred_engine == ExtractionEngine.UPSTAGE:
+            is_text_pdf = await asyncio.to_thread(self._is_text_pdf_cheap, pdf_bytes)
+            
+            self.probe_stats["probes"] += 1
+            if is_text_pdf:
+                self.probe_stats["hits"] += 1
+                if self.verbose:
+                    logger.info("⚡ 텍스트 PDF 감지: PyMuPDF 우선 시도")
+        
         # 엔진 시도 순서 결정
-        engine_order = self._get_engine_order(preferred_engine)
+        engine_order = self._get_engine_order(preferred_engine, is_text_pdf)
+        
+        # 검증 단계에서 확인한 페이지 수 (가벼운 검증이면 None, OCR 작업 분배에 사용)
+        page_count = validation_result["info"].get("page_count")
         
         last_error = None
         
+        # 헤지 모드: Upstage와 PyMuPDF를 동시에 실행, 먼저 충분한 텍스트를 낸 엔진 채택
+        if hedged and preferred_engine == ExtractionEngine.UPSTAGE and self.upstage_api_key:
+            hedge_engines = [ExtractionEngine.UPSTAGE, ExtractionEngine.PYMUPDF]
+            text, engine, last_error = await self._extract_hedged(pdf_bytes, pdf_digest, file_path, hedge_engines)
+            
+            if engine is not None:
+                self.engine_stats[engine, "hedge_wins"] += 1
+                return self._accept_text(text, engine, start_ns)
+            
+            # 둘 다 실패하면 나머지 엔진으로 계속 폴백
+            engine_order = [engine for engine in engine_order if engine not in hedge_engines]
+        
         for engine in engine_order:
             try:
                 if self.verbose:
                     logger.info(f"🔧 {engine.value} 엔진으로 시도 중...")
                 
-                text = await self._extract_with_engine(file_path, engine)
+                text = await self._extract_with_engine(pdf_bytes, pdf_digest, file_path, engine, page_count)
                 
                 # 최소 텍스트 길이 확인 (더 관대하게)
-                min_length = 20 if engine == ExtractionEngine.UPSTAGE else 50
-                if text and len(text.strip()) > min_length:
-                    processing_time = (datetime.now() - start_time).total_seconds()
-                    
-                    # 통계 업데이트
-                    self.engine_stats[engine]["success"] += 1
-                    self.engine_stats[engine]["total_time"] += processing_time
-                    
-                    if self.verbose:
-                        logger.info(f"✅ {engine.value} 성공 ({processing_time:.2f}초)")
-                    
-                    return clean_text(text), engine, processing_time
-                else:
-                    if self.verbose:
-                        logger.warning(f"⚠️ {engine.value} 텍스트 부족 (길이: {len(text) if text else 0}, 최소: {min_length})")
+                if self._has_enough_text(text, engine):
+                    return self._accept_text(text, engine, start_ns)
                         
             except Exception as e:
                 last_error = e
-                self.engine_stats[engine]["failure"] += 1
+                self.engine_stats[engine, "failure"] += 1
                 
                 if self.verbose:
                     logger.error(f"❌ {engine.value} 실패: {str(e)}")
@@ -134,24 +530,135 @@ class PDFParsingEngine:
                 continue
         
         # 모든 엔진 실패
-        processing_time = (datetime.now() - start_time).total_seconds()
         raise RuntimeError(f"모든 PDF 추출 엔진 실패. 마지막 오류: {last_error}")
     
-    async def _extract_with_engine(self, file_path: str, engine: ExtractionEngine) -> str:
-        """개별 엔진으로 텍스트 추출"""
+    def _has_enough_text(self, text: str, engine: ExtractionEngine) -> bool:
+        """엔진별 최소 텍스트 길이 충족 여부 (Upstage는 더 관대하게)"""
+        
+        min_length = _UPSTAGE_MIN_TEXT_LENGTH if engine == ExtractionEngine.UPSTAGE else _MIN_TEXT_LENGTH
+        if text and len(text.strip()) > min_length:
+            return True
+        
+        if self.verbose:
+            logger.warning(f"⚠️ {engine.value} 텍스트 부족 (길이: {len(text) if text else 0}, 최소: {min_length})")
+        return False
+    
+    def _accept_text(
+        self, 
+        text: str, 
+        engine: ExtractionEngine, 
+        start_ns: int
+    ) -> Tuple[str, ExtractionEngine, float]:
+        """성공한 엔진 결과 채택 (통계 업데이트 후 정리된 텍스트 반환)"""
+        
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        processing_time = elapsed_ns / 1e9
+        
+        # 통계 업데이트 (누적 시간은 정수 나노초로 유지, 조회 시에만 초 단위 변환)
+        self.engine_stats[engine, "success"] += 1
+        self.engine_stats[engine, "total_time_ns"] += elapsed_ns
+        
+        if self.verbose:
+            logger.info(f"✅ {engine.value} 성공 ({processing_time:.2f}초)")
+        
+        return clean_text(text), engine, processing_time
+    
+    async def _extract_hedged(
+        self, 
+        pdf_bytes: bytes, 
+        pdf_digest: str, 
+        file_path: str, 
+        engines: List[ExtractionEngine]
+    ) -> Tuple[Optional[str], Optional[ExtractionEngine], Optional[Exception]]:
+        """
+        여러 엔진을 동시에 실행하고 먼저 충분한 텍스트를 낸 결과 채택 (나머지는 취소)
+        
+        Returns:
+            (추출된_텍스트, 채택된_엔진, 마지막_오류) - 모두 실패하면 엔진은 None
+        """
+        if self.verbose:
+            logger.info(f"🏁 헤지 실행: {', '.join(engine.value for engine in engines)}")
+        
+        tasks = {
+            asyncio.create_task(self._extract_with_engine(pdf_bytes, pdf_digest, file_path, engine)): engine
+            for engine in engines
+        }
+        last_error = None
+        
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                
+                # 동시에 끝난 경우 엔진 우선순위 순으로 확인
+                for task in sorted(done, key=lambda task: engines.index(tasks[task])):
+                    engine = tasks[task]
+                    
+                    try:
+                        text = task.result()
+                    except Exception as e:
+                        last_error = e
+                        self.engine_stats[engine, "failure"] += 1
+                        
+                        if self.verbose:
+                            logger.error(f"❌ {engine.value} 실패: {str(e)}")
+                        continue
+                    
+                    if self._has_enough_text(text, engine):
+                        return text, engine, last_error
+            
+            return None, None, last_error
+        finally:
+            # 채택되지 않은 엔진 작업 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def _extract_with_engine(
+        self, 
+        pdf_bytes: bytes, 
+        pdf_digest: str, 
+        file_path: str, 
+        engine: ExtractionEngine,
+        page_count: Optional[int] = None
+    ) -> str:
+        """개별 엔진으로 텍스트 추출 (page_count: 알고 있으면 OCR 워커 수를 페이지 수로 제한)"""
         
         if engine == ExtractionEngine.UPSTAGE:
-            return await self._extract_with_upstage(file_path)
+            # Upstage는 원본 응답을 별도로 캐시
+            return await self._extract_with_upstage(pdf_bytes, pdf_digest, file_path)
         elif engine == ExtractionEngine.PYMUPDF:
-            return await self._extract_with_pymupdf(file_path)
+            extract = self._extract_with_pymupdf
         elif engine == ExtractionEngine.PDFPLUMBER:
-            return await self._extract_with_pdfplumber(file_path)
+            extract = self._extract_with_pdfplumber
         elif engine == ExtractionEngine.TESSERACT:
-            return await self._extract_with_tesseract(file_path)
+            extract = partial(self._extract_with_tesseract, page_count=page_count)
         else:
             raise ValueError(f"지원하지 않는 엔진: {engine}")
+        
+        if self.text_cache is None:
+            text, _ = await extract(pdf_bytes, file_path)
+            return text
+        
+        # 동일한 파일을 같은 엔진으로 추출한 결과가 있으면 재사용
+        cache_key = f"v1_{pdf_digest}_{engine.value}.txt"
+        cached = await asyncio.to_thread(self.text_cache.get, cache_key)
+        
+        if cached is not None:
+            self.engine_stats[engine, "cache_hits"] += 1
+            
+            if self.verbose:
+                logger.info(f"💾 {engine.value}: 캐시된 추출 결과 사용")
+            return cached.decode("utf-8")
+        
+        text, complete = await extract(pdf_bytes, file_path)
+        
+        # 일부 페이지 OCR이 실패했거나 채택 기준에 못 미치는 결과는 저장하지 않음 (다음 실행에서 재시도)
+        if complete and len(text.strip()) > _MIN_TEXT_LENGTH:
+            await asyncio.to_thread(self.text_cache.set, cache_key, text.encode("utf-8"))
+        return text
     
-    async def _extract_with_upstage(self, file_path: str) -> str:
+    async def _extract_with_upstage(self, pdf_bytes: bytes, pdf_digest: str, file_path: str) -> str:
         """Upstage Document Parse API로 텍스트 추출"""
         
         if not self.upstage_api_key:
@@ -162,25 +669,40 @@ class PDFParsingEngine:
             url = "https://api.upstage.ai/v1/document-digitization"
             headers = {"Authorization": f"Bearer {self.upstage_api_key}"}
             
-            # 파일 열기
-            with open(file_path, "rb") as file:
-                files = {"document": file}
+            # 동일한 파일의 캐시된 응답이 있으면 API 호출 생략
+            cache_key = f"v1_{pdf_digest}.json"
+            cached = None
+            if self.upstage_cache is not None:
+                cached = await asyncio.to_thread(self.upstage_cache.get, cache_key)
+            
+            if cached is not None:
+                result = orjson.loads(cached)
+                self.engine_stats[ExtractionEngine.UPSTAGE, "cache_hits"] += 1
+                
+                if self.verbose:
+                    logger.info("🚀 Upstage: 캐시된 응답 사용 (API 호출 생략)")
+            else:
+                files = {"document": (Path(file_path).name, pdf_bytes, "application/pdf")}
                 data = {
                     "ocr": "force",
                     "base64_encoding": "['table']",
                     "model": "document-parse"
                 }
                 
-                # 비동기 처리를 위해 별도 스레드에서 실행
-                response = await asyncio.to_thread(
-                    requests.post, url, headers=headers, files=files, data=data
+                # 스레드를 점유하지 않는 비동기 HTTP 요청
+                response = await self._post_upstage(
+                    url, headers=headers, files=files, data=data
                 )
-            
-            if response.status_code != 200:
-                raise ValueError(f"Upstage API 오류: {response.status_code} - {response.text}")
-            
-            # JSON 응답 파싱
-            result = response.json()
+                
+                if response.status_code != 200:
+                    raise ValueError(f"Upstage API 오류: {response.status_code} - {response.text}")
+                
+                # JSON 응답 파싱
+                result = orjson.loads(response.content)
+                
+                # 원본 응답 캐시 저장
+                if self.upstage_cache is not None:
+                    await asyncio.to_thread(self.upstage_cache.set, cache_key, response.content)
             
             # 텍스트 추출
             full_text = ""
@@ -216,146 +738,174 @@ class PDFParsingEngine:
                 logger.error(f"🚀 Upstage 오류: {str(e)}")
             raise
     
-    async def _extract_with_pymupdf(self, file_path: str) -> str:
-        """PyMuPDF로 텍스트 추출 (OCR 포함)"""
+    async def _extract_with_pymupdf(self, pdf_bytes: bytes, file_path: str) -> Tuple[str, bool]:
+        """
+        PyMuPDF로 텍스트 추출 (OCR 포함)
+        
+        Returns:
+            (추출된_텍스트, OCR_실패_페이지_없음_여부)
+        """
         
         try:
-            doc = fitz.open(file_path)
-            text_parts = []
+            # 1단계: 일반 텍스트 추출 (빠르므로 현재 프로세스에서 처리, 이벤트 루프를 막지 않도록 스레드에서 실행)
+            page_texts, ocr_pages, blank_pages = await asyncio.to_thread(_pymupdf_text_pass, pdf_bytes)
             
-            if len(doc) == 0:
-                doc.close()
-                raise ValueError("PDF에 페이지가 없습니다")
+            if self.verbose and blank_pages:
+                logger.info(f"⚡ PyMuPDF: 이미지가 거의 없는 {blank_pages}개 페이지는 OCR 생략")
             
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
+            # 2단계: OCR 대상 페이지는 프로세스 풀에서 병렬 OCR
+            complete = True
+            
+            if ocr_pages:
+                # 워커 수만큼 페이지 묶음으로 나누어 PDF 바이트 전달 횟수 최소화
+                chunks = [ocr_pages[i::_OCR_MAX_WORKERS] for i in range(_OCR_MAX_WORKERS)]
+                chunks = [chunk for chunk in chunks if chunk]
                 
-                # 1단계: 일반 텍스트 추출 시도
-                text = page.get_text()
+                chunk_results = await asyncio.gather(
+                    *(
+                        self._run_in_pool(_pymupdf_ocr_page_worker, pdf_bytes, chunk)
+                        for chunk in chunks
+                    ),
+                    return_exceptions=True
+                )
                 
-                # 2단계: 텍스트가 없거나 매우 적으면 OCR 시도
-                if not text or len(text.strip()) < 50:
-                    try:
-                        # 페이지를 이미지로 렌더링
-                        pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x 확대
-                        img_data = pix.tobytes("png")
-                        
-                        # PIL Image로 변환
-                        from PIL import Image
-                        import io
-                        img = Image.open(io.BytesIO(img_data))
-                        
-                        # Tesseract OCR로 텍스트 추출
-                        import pytesseract
-                        ocr_text = pytesseract.image_to_string(
-                            img, 
-                            lang='kor+eng',
-                            config='--psm 6'
-                        )
-                        
-                        if ocr_text and len(ocr_text.strip()) > len(text.strip()):
-                            text = ocr_text
-                            if self.verbose:
-                                logger.info(f"⚡ PyMuPDF OCR: 페이지 {page_num + 1}에서 {len(ocr_text)}자 추출")
-                    
-                    except Exception as ocr_error:
+                ocr_texts = {}
+                for chunk, result in zip(chunks, chunk_results):
+                    # 워커 자체가 실패한 경우 (문서 열기 실패, 워커 프로세스 종료 등)
+                    if isinstance(result, Exception):
+                        complete = False
                         if self.verbose:
-                            logger.warning(f"⚡ PyMuPDF OCR 실패 (페이지 {page_num + 1}): {str(ocr_error)}")
+                            pages = ", ".join(str(page_num + 1) for page_num in chunk)
+                            logger.warning(f"⚡ PyMuPDF OCR 실패 (페이지 {pages}): {str(result)}")
+                        continue
+                    
+                    for page_num, ocr_text, error in result:
+                        if error is not None:
+                            complete = False
+                            if self.verbose:
+                                logger.warning(f"⚡ PyMuPDF OCR 실패 (페이지 {page_num + 1}): {error}")
+                            continue
+                        ocr_texts[page_num] = ocr_text
                 
-                if text and text.strip():
-                    text_parts.append(f"--- 페이지 {page_num + 1} ---\n{text}")
+                for page_num, ocr_text in sorted(ocr_texts.items()):
+                    if ocr_text and len(ocr_text.strip()) > len(page_texts[page_num].strip()):
+                        page_texts[page_num] = ocr_text
+                        if self.verbose:
+                            logger.info(f"⚡ PyMuPDF OCR: 페이지 {page_num + 1}에서 {len(ocr_text)}자 추출")
             
-            doc.close()
+            text_parts = [
+                f"--- 페이지 {page_num + 1} ---\n{text}"
+                for page_num, text in enumerate(page_texts)
+                if text and text.strip()
+            ]
             
             full_text = "\n\n".join(text_parts)
             
             if self.verbose:
                 logger.info(f"⚡ PyMuPDF: {len(text_parts)}페이지에서 {len(full_text)}자 추출")
             
-            return full_text
+            return full_text, complete
             
         except Exception as e:
             if self.verbose:
                 logger.error(f"⚡ PyMuPDF 오류: {str(e)}")
             raise
     
-    async def _extract_with_pdfplumber(self, file_path: str) -> str:
-        """pdfplumber로 텍스트 추출"""
+    async def _extract_with_pdfplumber(self, pdf_bytes: bytes, file_path: str) -> Tuple[str, bool]:
+        """
+        pdfplumber로 텍스트 추출
+        
+        Returns:
+            (추출된_텍스트, 완전한_결과_여부) - 오류는 예외로 전달되므로 항상 완전한 결과
+        """
         
         try:
-            text_parts = []
-            
-            with pdfplumber.open(file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    
-                    if text and text.strip():
-                        text_parts.append(f"--- 페이지 {page_num + 1} ---\n{text}")
-                        
-                        # 테이블도 추출 시도
-                        tables = page.extract_tables()
-                        for table_idx, table in enumerate(tables):
-                            if table:
-                                table_text = "\n".join([
-                                    " | ".join([cell or "" for cell in row])
-                                    for row in table
-                                ])
-                                text_parts.append(f"[테이블 {table_idx + 1}]\n{table_text}")
+            # pdfplumber import, 문서 열기, 페이지별 추출이 이벤트 루프를 막지 않도록 스레드에서 실행
+            # (pdfplumber는 순수 파이썬 위주라 스레드로 페이지를 나눠도 GIL 때문에 빨라지지 않음)
+            text_parts = await asyncio.to_thread(_pdfplumber_extract, pdf_bytes)
             
             full_text = "\n\n".join(text_parts)
             
             if self.verbose:
                 logger.info(f"🔍 pdfplumber: {len(text_parts)}페이지, {len(full_text)}자 추출")
             
-            return full_text
+            return full_text, True
             
         except Exception as e:
             if self.verbose:
                 logger.error(f"🔍 pdfplumber 오류: {str(e)}")
             raise
     
-    async def _extract_with_tesseract(self, file_path: str) -> str:
-        """Tesseract OCR로 텍스트 추출"""
+    async def _extract_with_tesseract(
+        self, 
+        pdf_bytes: bytes, 
+        file_path: str, 
+        page_count: Optional[int] = None
+    ) -> Tuple[str, bool]:
+        """
+        Tesseract OCR로 텍스트 추출
+        
+        Args:
+            pdf_bytes: PDF 내용
+            file_path: PDF 파일 경로
+            page_count: 페이지 수 (알고 있으면 페이지 수보다 많은 워커에 PDF를 보내지 않음)
+        
+        Returns:
+            (추출된_텍스트, OCR_실패_페이지_없음_여부)
+        """
         
         try:
-            # PDF를 이미지로 변환
-            images = convert_from_path(
-                file_path,
-                dpi=300,  # 고해상도
-                fmt='png'
+            # 워커마다 페이지를 나누어 렌더링 + 전처리 + OCR 병렬 실행 (PDF 바이트 전달 횟수 최소화)
+            # 페이지보다 워커가 많으면 빈 작업에도 PDF 전체가 전달되므로 작업 수를 페이지 수로 제한
+            workers = _OCR_MAX_WORKERS if page_count is None else max(1, min(_OCR_MAX_WORKERS, page_count))
+            chunk_results = await asyncio.gather(
+                *(
+                    self._run_in_pool(_tesseract_pages_worker, pdf_bytes, offset, workers)
+                    for offset in range(workers)
+                )
             )
             
-            text_parts = []
+            # 결과가 항상 페이지 순서가 되도록 정렬
+            page_results = sorted(
+                (page_result for result in chunk_results for page_result in result),
+                key=itemgetter(0)
+            )
             
-            for page_num, image in enumerate(images):
-                # 이미지 전처리 (OCR 정확도 향상)
-                processed_image = self._preprocess_image_for_ocr(image)
-                
-                # OCR 실행 (한국어 + 영어)
-                text = pytesseract.image_to_string(
-                    processed_image,
-                    lang='kor+eng',  # 한국어 + 영어
-                    config='--psm 6'  # 블록 단위 OCR
-                )
-                
-                if text.strip():
-                    text_parts.append(f"--- 페이지 {page_num + 1} ---\n{text}")
+            # 페이지 단위 OCR 실패는 해당 페이지만 제외 (전체 실패 시에는 엔진 실패로 처리)
+            failed_pages = [(page_num, error) for page_num, _, error in page_results if error is not None]
+            if failed_pages and len(failed_pages) == len(page_results):
+                raise RuntimeError(f"모든 페이지 OCR 실패: {failed_pages[0][1]}")
+            
+            if self.verbose:
+                for page_num, error in failed_pages:
+                    logger.warning(f"👁️ Tesseract OCR 실패 (페이지 {page_num + 1}): {error}")
+            
+            text_parts = [
+                f"--- 페이지 {page_num + 1} ---\n{text}"
+                for page_num, text, error in page_results
+                if error is None and text.strip()
+            ]
             
             full_text = "\n\n".join(text_parts)
             
             if self.verbose:
-                logger.info(f"👁️ Tesseract: {len(images)}페이지, {len(full_text)}자 추출")
+                logger.info(f"👁️ Tesseract: {len(page_results)}페이지, {len(full_text)}자 추출")
             
-            return full_text
+            return full_text, not failed_pages
             
         except Exception as e:
             if self.verbose:
                 logger.error(f"👁️ Tesseract 오류: {str(e)}")
             raise
     
-    def _preprocess_image_for_ocr(self, image: Image.Image) -> Image.Image:
+    @staticmethod
+    def _preprocess_image_for_ocr(image: Image.Image) -> Image.Image:
         """OCR 정확도 향상을 위한 이미지 전처리"""
         
+        opencv = _get_opencv()
+        if opencv is not None:
+            return PDFParsingEngine._preprocess_image_with_opencv(image, *opencv)
+        
         # 그레이스케일 변환
         if image.mode != 'L':
             image = image.convert('L')
@@ -365,7 +915,7 @@ class PDFParsingEngine:
         image = image.resize((width * 2, height * 2), Image.Resampling.LANCZOS)
         
         # 대비 향상
-        from PIL import ImageEnhance
+        ImageEnhance = _lazy_import("PIL.ImageEnhance")
         enhancer = ImageEnhance.Contrast(image)
         image = enhancer.enhance(1.3)
         
@@ -375,7 +925,69 @@ class PDFParsingEngine:
         
         return image
     
-    def _get_engine_order(self, preferred_engine: ExtractionEngine) -> List[ExtractionEngine]:
+    @staticmethod
+    def _preprocess_image_with_opencv(
+        image: Image.Image, 
+        cv2: Any, 
+        np: Any, 
+        sharpen_kernel: Any
+    ) -> Image.Image:
+        """
+        OpenCV 기반 OCR 전처리 (중간 이미지 생성 최소화)
+        
+        PIL 전처리와 같은 단계(그레이스케일 → 2배 확대 → 대비 1.3 → 선명도 1.2)를 따르지만,
+        Lanczos 커널 크기와 필터 경계/반올림 처리가 달라 픽셀 단위로 동일하지는 않습니다.
+        """
+        
+        # 그레이스케일 변환
+        arr = np.asarray(image.convert('L') if image.mode != 'L' else image)
+        
+        # 해상도 향상 (2배 확대)
+        arr = cv2.resize(arr, None, fx=2, fy=2, interpolation=cv2.INTER_LANCZOS4)
+        
+        # 대비 향상 (PIL과 같이 반올림한 평균 밝기 기준으로 1.3배, 단계마다 0~255로 잘라냄)
+        mean = int(arr.mean() + 0.5)
+        arr = np.clip(arr.astype(np.float32) * 1.3 + (1 - 1.3) * mean, 0, 255).astype(np.uint8)
+        
+        # 선명도 향상 (단일 컨볼루션, uint8 입력이므로 결과도 0~255로 포화)
+        arr = cv2.filter2D(arr, -1, sharpen_kernel)
+        
+        return Image.fromarray(arr)
+    
+    @staticmethod
+    def _is_text_pdf_cheap(pdf_bytes: bytes) -> bool:
+        """
+        첫 페이지만 확인하는 텍스트 PDF 사전 판별 (수십 ms 수준)
+        
+        텍스트 밀도가 충분하고 페이지 대부분이 이미지로 덮여 있지 않으면 True
+        """
+        try:
+            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        except Exception:
+            return False
+        
+        try:
+            if len(doc) == 0:
+                return False
+            
+            page = doc.load_page(0)
+            page_area = max(1.0, page.rect.width * page.rect.height)
+            
+            text_density = len(page.get_text().strip()) / page_area
+            if text_density < _TEXT_PROBE_MIN_DENSITY:
+                return False
+            
+            return _page_image_coverage(page) < _TEXT_PROBE_MAX_IMAGE_COVERAGE
+        except Exception:
+            return False
+        finally:
+            doc.close()
+    
+    def _get_engine_order(
+        self, 
+        preferred_engine: ExtractionEngine, 
+        is_text_pdf: bool = False
+    ) -> List[ExtractionEngine]:
         """엔진 시도 순서 결정"""
         
         # 기본 순서
@@ -386,6 +998,15 @@ class PDFParsingEngine:
             ExtractionEngine.TESSERACT
         ]
         
+        # 텍스트 PDF는 PyMuPDF 우선, 실패 시에만 Upstage 사용
+        if is_text_pdf and preferred_engine == ExtractionEngine.UPSTAGE:
+            return [
+                ExtractionEngine.PYMUPDF,
+                ExtractionEngine.UPSTAGE,
+                ExtractionEngine.PDFPLUMBER,
+                ExtractionEngine.TESSERACT
+            ]
+        
         # 선호 엔진을 맨 앞으로
         if preferred_engine in default_order:
             order = [preferred_engine]
@@ -399,20 +1020,60 @@ class PDFParsingEngine:
         
         stats = {}
         
-        for engine, data in self.engine_stats.items():
-            total_attempts = data["success"] + data["failure"]
-            success_rate = data["success"] / total_attempts if total_attempts > 0 else 0
-            avg_time = data["total_time"] / data["success"] if data["success"] > 0 else 0
+        data = self.engine_stats
+        
+        for engine in ExtractionEngine:
+            success = data[engine, "success"]
+            failure = data[engine, "failure"]
+            total_time = data[engine, "total_time_ns"] / 1e9
+            
+            total_attempts = success + failure
+            success_rate = success / total_attempts if total_attempts > 0 else 0
+            avg_time = total_time / success if success > 0 else 0
             
             stats[engine.value] = {
-                "success_count": data["success"],
-                "failure_count": data["failure"],
+                "success_count": success,
+                "failure_count": failure,
                 "success_rate": round(success_rate * 100, 1),
                 "average_time_seconds": round(avg_time, 2),
-                "total_time_seconds": round(data["total_time"], 2)
+                "total_time_seconds": round(total_time, 2),
+                "cache_hits": data[engine, "cache_hits"],
+                "hedge_wins": data[engine, "hedge_wins"]
             }
         
         return stats
+    
+    def get_probe_statistics(self) -> Dict[str, Any]:
+        """텍스트 PDF 사전 판별 통계 반환"""
+        
+        probes = self.probe_stats["probes"]
+        hit_rate = self.probe_stats["hits"] / probes if probes > 0 else 0
+        
+        return {
+            "probe_count": probes,
+            "hit_count": self.probe_stats["hits"],
+            "probe_hit_rate": round(hit_rate * 100, 1)
+        }
+
+
+class _KeywordTables(NamedTuple):
+    """문서 타입 감지기가 공유하는 키워드 조회 테이블"""
+    
+    kw_table: Tuple[Tuple[Any, ...], ...]
+    type_table: Tuple[Tuple[Any, ...], ...]
+    type_entries: Dict[DocumentType, Tuple[Any, ...]]
+    confidence_denominators: Dict[DocumentType, int]
+    automaton: Any
+
+
+class _DetectedRange(NamedTuple):
+    """페이지 범위 단위 문서 감지 결과 (인스턴스별 __dict__ 없는 경량 레코드)"""
+    
+    document_type: DocumentType
+    confidence: float
+    page_range: Tuple[int, int]
+    key_indicators: List[str]
+    text_spans: List[Tuple[int, int]]  # 원본 텍스트 내 페이지별 (시작, 끝) 문자 오프셋 (구분자 제외)
 
 
 class DocumentTypeDetector:
@@ -422,37 +1083,169 @@ class DocumentTypeDetector:
     추출된 텍스트를 분석하여 무역문서 타입을 식별합니다.
     """
     
+    # 개별 문서 분리용 번호 패턴 (페이지마다 재컴파일하지 않도록 클래스 상수로 유지)
+    _BL_PATTERNS = (
+        re.compile(r'b/?l\s*(?:no\.?)?\s*:?\s*([A-Z]{2,4}\d{6,12})', re.IGNORECASE),
+        re.compile(r'bill\s*of\s*lading\s*(?:no\.?)?\s*:?\s*([A-Z]{2,4}\d{6,12})', re.IGNORECASE),
+        re.compile(r'([A-Z]{2,4}\d{6,12})', re.IGNORECASE)  # 일반적인 B/L 번호 패턴
+    )
+    _DECL_PATTERNS = (
+        re.compile(r'신고번호\s*([0-9]{5}-[0-9]{2}-[0-9]{6}[A-Z]?)', re.IGNORECASE),
+        re.compile(r'(\d{5}-\d{2}-\d{6}[A-Z]?)', re.IGNORECASE)
+    )
+    _TAX_PATTERNS = (
+        re.compile(r'세금계산서.*?번호.*?([0-9-]+)', re.IGNORECASE),
+        re.compile(r'tax\s*invoice.*?no.*?([0-9-]+)', re.IGNORECASE)
+    )
+    _INV_PATTERNS = (
+        re.compile(r'invoice\s*(?:no\.?)?\s*:?\s*([A-Z0-9-]+)', re.IGNORECASE),
+        re.compile(r'commercial\s*invoice\s*(?:no\.?)?\s*:?\s*([A-Z0-9-]+)', re.IGNORECASE)
+    )
+    
+    # 문서 타입별 핵심 키워드 (모든 감지기 인스턴스가 공유)
+    _TYPE_KEYWORDS = {
+        DocumentType.TAX_INVOICE: {
+            "primary": ["세금계산서", "tax invoice", "공급가액", "세액", "부가가치세"],
+            "secondary": ["사업자등록번호", "합계금액", "공급자", "공급받는자", "발행일자"],
+            "negative": []  # 이 키워드가 있으면 해당 타입이 아님
+        },
+        DocumentType.INVOICE: {
+            "primary": ["invoice", "commercial invoice", "proforma invoice"],
+            "secondary": ["description", "quantity", "unit price", "amount", "total"],
+            "negative": ["세금계산서", "tax invoice"]
+        },
+        DocumentType.BILL_OF_LADING: {
+            "primary": ["bill of lading", "b/l", "bl"],
+            "secondary": ["port of loading", "port of discharge", "vessel", "voyage", "shipper", "consignee"],
+            "negative": []
+        },
+        DocumentType.EXPORT_DECLARATION: {
+            "primary": ["수출신고", "export declaration", "신고번호"],
+            "secondary": ["세번", "hs code", "목적국", "적재항", "송품장"],
+            "negative": []
+        },
+        DocumentType.TRANSFER_CONFIRMATION: {
+            "primary": ["이체확인", "transfer confirmation", "송금확인"],
+            "secondary": ["승인번호", "계좌번호", "송금금액", "approval", "account"],
+            "negative": []
+        }
+    }
+    
+    # 키워드 카테고리별 가중치
+    _CATEGORY_WEIGHTS = {"primary": 3, "secondary": 1, "negative": -2}
+    
+    # 차점자 대비 3배 이상이면서 이 점수를 넘으면 결정적 판정으로 간주
+    _DECISIVE_MIN_SCORE = 5
+    
+    # 페이지 구분자 패턴 (한 번의 스캔으로 모든 구분자 탐색)
+    _PAGE_SPLIT_RE = re.compile(
+        r'(?P<marker>--- 페이지 \d+ ---)'
+        r'|(?P<page>Page \d+)'
+        r'|(?P<formfeed>\f)'  # Form feed character
+    )
+    
+    # 페이지 구분자 우선순위 (텍스트에 있는 것 중 가장 앞선 종류로만 분리)
+    _PAGE_SPLIT_PRIORITY = ("marker", "page", "formfeed")
+    
+    # 페이지 구분자에 반드시 포함되는 리터럴 (하나도 없으면 정규식 스캔 생략)
+    _PAGE_SPLIT_LITERALS = ("--- 페이지 ", "Page ", "\f")
+    
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
         
-        # 문서 타입별 핵심 키워드
-        self.type_keywords = {
-            DocumentType.TAX_INVOICE: {
-                "primary": ["세금계산서", "tax invoice", "공급가액", "세액", "부가가치세"],
-                "secondary": ["사업자등록번호", "합계금액", "공급자", "공급받는자", "발행일자"],
-                "negative": []  # 이 키워드가 있으면 해당 타입이 아님
-            },
-            DocumentType.INVOICE: {
-                "primary": ["invoice", "commercial invoice", "proforma invoice"],
-                "secondary": ["description", "quantity", "unit price", "amount", "total"],
-                "negative": ["세금계산서", "tax invoice"]
-            },
-            DocumentType.BILL_OF_LADING: {
-                "primary": ["bill of lading", "b/l", "bl"],
-                "secondary": ["port of loading", "port of discharge", "vessel", "voyage", "shipper", "consignee"],
-                "negative": []
-            },
-            DocumentType.EXPORT_DECLARATION: {
-                "primary": ["수출신고", "export declaration", "신고번호"],
-                "secondary": ["세번", "hs code", "목적국", "적재항", "송품장"],
-                "negative": []
+        # 키워드 테이블과 Aho-Corasick 오토마톤은 프로세스 내 모든 감지기가 공유 (한 번만 생성)
+        tables = self._get_shared_tables()
+        self.type_keywords = self._TYPE_KEYWORDS
+        self._category_weights = self._CATEGORY_WEIGHTS
+        self._kw_table = tables.kw_table
+        self._type_table = tables.type_table
+        self._type_entries = tables.type_entries
+        self._confidence_denominators = tables.confidence_denominators
+        self._keyword_automaton = tables.automaton
+        
+        # 페이지 텍스트 다이제스트별 타입 감지 결과 LRU 캐시 (재처리/재시도 시 동일 페이지 재계산 방지)
+        # 페이지 텍스트 전체를 키로 보관하지 않도록 16바이트 다이제스트만 저장
+        self._page_cache: "OrderedDict[bytes, Tuple[DocumentType, float, FrozenSet[str]]]" = OrderedDict()
+        self._page_cache_lock = threading.Lock()  # 여러 PDF 감지가 스레드에서 동시에 실행됨
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_shared_tables(cls) -> "_KeywordTables":
+        """키워드 기반 조회 테이블 생성 (클래스별 한 번만 생성 후 공유)"""
+        
+        type_keywords = cls._TYPE_KEYWORDS
+        
+        # 소문자 키워드를 미리 계산한 평탄화 테이블: (소문자_키워드, 가중치, 문서_타입, 카테고리, 원본_키워드)
+        kw_table = tuple(
+            (keyword.lower(), weight, doc_type, category, keyword)
+            for doc_type, keywords in type_keywords.items()
+            for category, weight in cls._CATEGORY_WEIGHTS.items()
+            for keyword in keywords[category]
+        )
+        
+        # 문서 타입별 평탄화 테이블: (문서_타입, 타입_값, 전체_소문자_키워드_집합, primary, secondary, negative)
+        # 각 카테고리는 (소문자_키워드, 원본_키워드) 튜플 (정의 순서 유지)
+        type_table = tuple(
+            (
+                doc_type,
+                doc_type.value,
+                frozenset(
+                    keyword.lower()
+                    for category in ("primary", "secondary", "negative")
+                    for keyword in keywords[category]
+                ),
+                *(
+                    tuple((keyword.lower(), keyword) for keyword in keywords[category])
+                    for category in ("primary", "secondary", "negative")
+                )
+            )
+            for doc_type, keywords in type_keywords.items()
+        )
+        
+        return _KeywordTables(
+            kw_table=kw_table,
+            type_table=type_table,
+            # 문서 타입별 테이블 항목 조회용
+            type_entries={entry[0]: entry for entry in type_table},
+            # 문서 타입별 신뢰도 정규화 분모 ((primary + secondary 키워드 수) × 2)
+            confidence_denominators={
+                doc_type: (len(keywords["primary"]) + len(keywords["secondary"])) * 2
+                for doc_type, keywords in type_keywords.items()
             },
-            DocumentType.TRANSFER_CONFIRMATION: {
-                "primary": ["이체확인", "transfer confirmation", "송금확인"],
-                "secondary": ["승인번호", "계좌번호", "송금금액", "approval", "account"],
-                "negative": []
-            }
-        }
+            # 모든 키워드를 한 번의 선형 스캔으로 찾기 위한 Aho-Corasick 오토마톤
+            automaton=cls._build_keyword_automaton(kw_table)
+        )
+    
+    @staticmethod
+    def _build_keyword_automaton(kw_table: Tuple[Tuple[Any, ...], ...]) -> Any:
+        """전체 문서 타입 키워드(소문자)로 Aho-Corasick 오토마톤 생성 (미설치 시 정규식 합집합)"""
+        
+        if ahocorasick is None:
+            # 전방탐색으로 감싸 겹치는 출현까지 모두 집계 (같은 위치에서는 긴 키워드 우선)
+            keywords = sorted({keyword_lower for keyword_lower, *_ in kw_table}, key=len, reverse=True)
+            return re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+        
+        automaton = ahocorasick.Automaton()
+        for keyword_lower, *_ in kw_table:
+            automaton.add_word(keyword_lower, keyword_lower)
+        
+        automaton.make_automaton()
+        return automaton
+    
+    def _scan_keywords(self, text_lower: str) -> Dict[str, int]:
+        """
+        소문자 텍스트를 한 번만 스캔하여 키워드별 출현 횟수 계산
+        
+        Args:
+            text_lower: 소문자로 변환된 텍스트
+            
+        Returns:
+            {소문자_키워드: 출현_횟수}
+        """
+        if ahocorasick is None:
+            return Counter(self._keyword_automaton.findall(text_lower))
+        
+        return Counter(keyword for _, keyword in self._keyword_automaton.iter(text_lower))
     
     def detect_document_type(self, text: str) -> Tuple[DocumentType, float]:
         """
@@ -465,63 +1258,118 @@ class DocumentTypeDetector:
             (감지된_문서_타입, 신뢰도)
         """
         
-        if not text or len(text.strip()) < 20:
-            return DocumentType.UNKNOWN, 0.0
+        doc_type, confidence, _ = self._detect_with_keywords(text)
+        return doc_type, confidence
+    
+    def _detect_page(self, page_text: str) -> Tuple[DocumentType, float, FrozenSet[str]]:
+        """페이지 타입 감지 + 발견된 소문자 키워드 집합 (페이지 캐시 대상)"""
         
-        text_lower = text.lower()
-        scores = {}
+        doc_type, confidence, keyword_counts = self._detect_with_keywords(page_text)
+        return doc_type, confidence, frozenset(keyword_counts)
+    
+    def _detect_page_cached(self, page_text: str) -> Tuple[DocumentType, float, FrozenSet[str]]:
+        """페이지 타입 감지 (페이지 텍스트 다이제스트 기준 LRU 캐시)"""
         
-        # 각 문서 타입별 점수 계산
-        for doc_type, keywords in self.type_keywords.items():
-            score = 0.0
-            found_keywords = []
-            
-            # Primary 키워드 점수 (가중치 3)
-            for keyword in keywords["primary"]:
-                count = text_lower.count(keyword.lower())
-                if count > 0:
-                    score += count * 3
-                    found_keywords.append(keyword)
-            
-            # Secondary 키워드 점수 (가중치 1)
-            for keyword in keywords["secondary"]:
-                count = text_lower.count(keyword.lower())
-                if count > 0:
-                    score += count * 1
-                    found_keywords.append(keyword)
-            
-            # Negative 키워드 패널티 (가중치 -2)
-            for keyword in keywords["negative"]:
-                count = text_lower.count(keyword.lower())
-                if count > 0:
-                    score -= count * 2
-            
-            scores[doc_type] = {
-                "score": score,
-                "found_keywords": found_keywords[:5]  # 최대 5개까지
-            }
-            
-            if self.verbose and score > 0:
-                logger.info(f"📋 {doc_type.value}: {score}점 ({len(found_keywords)}개 키워드)")
+        key = hashlib.blake2b(page_text.encode("utf-8"), digest_size=16).digest()
+        
+        with self._page_cache_lock:
+            cached = self._page_cache.get(key)
+            if cached is not None:
+                self._page_cache.move_to_end(key)
+                return cached
+        
+        result = self._detect_page(page_text)
+        
+        with self._page_cache_lock:
+            self._page_cache[key] = result
+            if len(self._page_cache) > _PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+        
+        return result
+    
+    def _detect_with_keywords(self, text: str) -> Tuple[DocumentType, float, Dict[str, int]]:
+        """
+        문서 타입 감지 (키워드 스캔 결과도 함께 반환)
+        
+        Returns:
+            (감지된_문서_타입, 신뢰도, {소문자_키워드: 출현_횟수})
+        """
+        
+        if not text:
+            return DocumentType.UNKNOWN, 0.0, {}
         
-        # 최고 점수 문서 타입 선택
-        if not scores or all(data["score"] <= 0 for data in scores.values()):
-            return DocumentType.UNKNOWN, 0.0
+        # 전체 키워드 출현 횟수를 한 번의 스캔으로 계산
+        keyword_counts = self._scan_keywords(text.lower())
         
-        best_type = max(scores.items(), key=lambda x: x[1]["score"])
-        doc_type, data = best_type
+        if len(text.strip()) < 20:
+            return DocumentType.UNKNOWN, 0.0, keyword_counts
+        
+        scores = dict.fromkeys(self.type_keywords, 0)
+        
+        # 각 문서 타입별 점수 계산 (Primary 3점, Secondary 1점, Negative -2점)
+        for keyword_lower, weight, doc_type, _, _ in self._kw_table:
+            count = keyword_counts.get(keyword_lower)
+            if count:
+                scores[doc_type] += count * weight
+        
+        # 최고 점수 문서 타입 선택 (동점이면 먼저 정의된 타입 우선)
+        ranked = sorted(scores.items(), key=itemgetter(1), reverse=True)
+        doc_type, max_score = ranked[0]
+        
+        if max_score <= 0:
+            return DocumentType.UNKNOWN, 0.0, keyword_counts
+        
+        # 차점자와 격차가 작을 때만 타입별 상세 점수 로그 출력
+        runner_up_score = ranked[1][1] if len(ranked) > 1 else 0
+        is_decisive = max_score > max(self._DECISIVE_MIN_SCORE, 3 * runner_up_score)
+        
+        if self.verbose and not is_decisive:
+            self._log_type_scores(keyword_counts, scores)
         
         # 신뢰도 계산 (0~1)
-        max_score = data["score"]
-        total_keywords = len(self.type_keywords[doc_type]["primary"]) + len(self.type_keywords[doc_type]["secondary"])
-        confidence = min(1.0, max_score / (total_keywords * 2))  # 정규화
+        confidence = min(1.0, max_score / self._confidence_denominators[doc_type])  # 정규화
         
         if self.verbose:
             logger.info(f"🎯 감지 결과: {doc_type.value} (신뢰도: {confidence:.2f})")
         
-        return doc_type, confidence
+        return doc_type, confidence, keyword_counts
     
-    def detect_multiple_documents(self, text: str) -> List[Tuple[DocumentType, float, Tuple[int, int]]]:
+    def get_key_indicators(self, doc_type: DocumentType, found_keywords: Container[str]) -> List[str]:
+        """
+        발견된 키워드 중 문서 타입 감지에 사용된 핵심 키워드 반환
+        
+        Args:
+            doc_type: 문서 타입
+            found_keywords: 발견된 소문자 키워드 집합 (또는 키워드별 출현 횟수)
+            
+        Returns:
+            Primary 키워드 + Secondary 키워드 최대 3개 (전체 최대 5개, 정의 순서)
+        """
+        entry = self._type_entries.get(doc_type)
+        if entry is None:
+            return []
+        
+        _, _, _, primary, secondary, _ = entry
+        
+        found_primary = [keyword for keyword_lower, keyword in primary if keyword_lower in found_keywords]
+        found_secondary = [keyword for keyword_lower, keyword in secondary if keyword_lower in found_keywords]
+        
+        return (found_primary + found_secondary[:3])[:5]  # Secondary 최대 3개, 전체 최대 5개 반환
+    
+    def _log_type_scores(self, keyword_counts: Dict[str, int], scores: Dict[DocumentType, float]) -> None:
+        """문서 타입별 점수와 발견 키워드 수 로그 출력"""
+        
+        found_counts = Counter(
+            doc_type
+            for keyword_lower, weight, doc_type, _, _ in self._kw_table
+            if weight > 0 and keyword_counts.get(keyword_lower)
+        )
+        
+        for doc_type, score in scores.items():
+            if score > 0:
+                logger.info(f"📋 {doc_type.value}: {score}점 ({found_counts[doc_type]}개 키워드)")
+    
+    def detect_multiple_documents(self, text: str) -> List[_DetectedRange]:
         """
         텍스트에서 복수 문서 타입 감지 및 개별 문서 분리
         
@@ -529,17 +1377,20 @@ class DocumentTypeDetector:
             text: 추출된 텍스트 (페이지 구분자 포함)
             
         Returns:
-            List[(문서_타입, 신뢰도, 페이지_범위)]
+            List[_DetectedRange(문서_타입, 신뢰도, 페이지_범위, 핵심_키워드, 페이지별_텍스트_위치)]
         """
         
-        # 페이지별로 텍스트 분리
-        pages = self._split_text_by_pages(text)
+        # 페이지별로 텍스트 분리 (한 번만 분리하고 오프셋은 결과에 함께 반환)
+        page_spans = self._split_page_spans(text)
+        pages = [text[start:end] for start, end in page_spans]
         
         # 1단계: 페이지별 문서 타입 감지
         page_doc_types = []
+        page_keywords = []  # 페이지별 발견 키워드 (핵심 키워드 산출용, 재스캔 방지)
         for page_num, page_text in enumerate(pages, 1):
-            doc_type, confidence = self.detect_document_type(page_text)
+            doc_type, confidence, found_keywords = self._detect_page_cached(page_text)
             page_doc_types.append((page_num, doc_type, confidence, page_text))
+            page_keywords.append(found_keywords)
         
         # 2단계: 동일한 문서 타입 내에서 개별 문서 분리
         detected_docs = []
@@ -566,7 +1417,18 @@ class DocumentTypeDetector:
             for i, (dtype, conf, pages) in enumerate(detected_docs):
                 logger.info(f"  {i+1}. {dtype.value} (페이지 {pages[0]}-{pages[1]}, 신뢰도: {conf:.2f})")
         
-        return detected_docs
+        # 4단계: 페이지 범위 내 발견 키워드를 합쳐 핵심 키워드 산출 (페이지별 텍스트 위치도 함께 반환)
+        results = []
+        for dtype, conf, (start_page, end_page) in detected_docs:
+            page_slice = slice(max(0, start_page - 1), end_page)
+            range_keywords = frozenset().union(*page_keywords[page_slice])
+            results.append(_DetectedRange(
+                dtype, conf, (start_page, end_page),
+                self.get_key_indicators(dtype, range_keywords),
+                page_spans[page_slice]
+            ))
+        
+        return results
     
     def _split_individual_documents(self, doc_group: List[Tuple[int, DocumentType, float, str]]) -> List[Tuple[DocumentType, float, Tuple[int, int]]]:
         """
@@ -630,29 +1492,35 @@ class DocumentTypeDetector:
         
         return individual_docs
     
+    @staticmethod
+    def _find_document_number(patterns: Tuple["re.Pattern", ...], page_text: str) -> Optional[str]:
+        """
+        페이지에서 가장 먼저 매칭되는 문서 번호 추출
+        
+        Args:
+            patterns: 우선순위 순 번호 패턴들
+            page_text: 페이지 텍스트
+            
+        Returns:
+            문서 번호 (없으면 None)
+        """
+        for pattern in patterns:
+            match = pattern.search(page_text)
+            if match:
+                return match.group(1)
+        return None
+    
     def _group_by_bl_number(self, doc_group: List[Tuple[int, DocumentType, float, str]]) -> Dict[str, List[Tuple[int, DocumentType, float, str]]]:
         """B/L 번호로 페이지들을 그룹화"""
         
-        bl_patterns = [
-            re.compile(r'b/?l\s*(?:no\.?)?\s*:?\s*([A-Z]{2,4}\d{6,12})', re.IGNORECASE),
-            re.compile(r'bill\s*of\s*lading\s*(?:no\.?)?\s*:?\s*([A-Z]{2,4}\d{6,12})', re.IGNORECASE),
-            re.compile(r'([A-Z]{2,4}\d{6,12})', re.IGNORECASE)  # 일반적인 B/L 번호 패턴
-        ]
-        
         groups = {}
         unknown_count = 1
         
         for page_info in doc_group:
             page_num, doc_type, confidence, page_text = page_info
-            bl_number = None
             
             # B/L 번호 찾기
-            for pattern in bl_patterns:
-                matches = pattern.findall(page_text)
-                if matches:
-                    # 가장 앞에 나오는 B/L 번호 사용
-                    bl_number = matches[0]
-                    break
+            bl_number = self._find_document_number(self._BL_PATTERNS, page_text)
             
             # B/L 번호를 찾지 못한 경우
             if not bl_number:
@@ -668,24 +1536,14 @@ class DocumentTypeDetector:
     def _group_by_declaration_number(self, doc_group: List[Tuple[int, DocumentType, float, str]]) -> Dict[str, List[Tuple[int, DocumentType, float, str]]]:
         """신고번호로 페이지들을 그룹화"""
         
-        decl_patterns = [
-            re.compile(r'신고번호\s*([0-9]{5}-[0-9]{2}-[0-9]{6}[A-Z]?)', re.IGNORECASE),
-            re.compile(r'(\d{5}-\d{2}-\d{6}[A-Z]?)', re.IGNORECASE)
-        ]
-        
         groups = {}
         unknown_count = 1
         
         for page_info in doc_group:
             page_num, doc_type, confidence, page_text = page_info
-            decl_number = None
             
             # 신고번호 찾기
-            for pattern in decl_patterns:
-                matches = pattern.findall(page_text)
-                if matches:
-                    decl_number = matches[0]
-                    break
+            decl_number = self._find_document_number(self._DECL_PATTERNS, page_text)
             
             # 신고번호를 찾지 못한 경우
             if not decl_number:
@@ -701,24 +1559,14 @@ class DocumentTypeDetector:
     def _group_by_tax_invoice_number(self, doc_group: List[Tuple[int, DocumentType, float, str]]) -> Dict[str, List[Tuple[int, DocumentType, float, str]]]:
         """세금계산서 번호로 페이지들을 그룹화"""
         
-        tax_patterns = [
-            re.compile(r'세금계산서.*?번호.*?([0-9-]+)', re.IGNORECASE),
-            re.compile(r'tax\s*invoice.*?no.*?([0-9-]+)', re.IGNORECASE)
-        ]
-        
         groups = {}
         unknown_count = 1
         
         for page_info in doc_group:
             page_num, doc_type, confidence, page_text = page_info
-            tax_number = None
             
             # 세금계산서 번호 찾기
-            for pattern in tax_patterns:
-                matches = pattern.findall(page_text)
-                if matches:
-                    tax_number = matches[0]
-                    break
+            tax_number = self._find_document_number(self._TAX_PATTERNS, page_text)
             
             # 세금계산서 번호를 찾지 못한 경우
             if not tax_number:
@@ -734,24 +1582,14 @@ class DocumentTypeDetector:
     def _group_by_invoice_number(self, doc_group: List[Tuple[int, DocumentType, float, str]]) -> Dict[str, List[Tuple[int, DocumentType, float, str]]]:
         """인보이스 번호로 페이지들을 그룹화"""
         
-        invoice_patterns = [
-            re.compile(r'invoice\s*(?:no\.?)?\s*:?\s*([A-Z0-9-]+)', re.IGNORECASE),
-            re.compile(r'commercial\s*invoice\s*(?:no\.?)?\s*:?\s*([A-Z0-9-]+)', re.IGNORECASE)
-        ]
-        
         groups = {}
         unknown_count = 1
         
         for page_info in doc_group:
             page_num, doc_type, confidence, page_text = page_info
-            invoice_number = None
             
             # 인보이스 번호 찾기
-            for pattern in invoice_patterns:
-                matches = pattern.findall(page_text)
-                if matches:
-                    invoice_number = matches[0]
-                    break
+            invoice_number = self._find_document_number(self._INV_PATTERNS, page_text)
             
             # 인보이스 번호를 찾지 못한 경우
             if not invoice_number:
@@ -766,36 +1604,49 @@ class DocumentTypeDetector:
     
     def _split_text_by_pages(self, text: str) -> List[str]:
         """페이지 구분자로 텍스트 분리"""
-        
-        # 페이지 구분자 패턴들
-        page_patterns = [
-            r'--- 페이지 (\d+) ---',
-            r'Page (\d+)',
-            r'\f',  # Form feed character
-        ]
-        
-        # 페이지 구분자로 분리
-        pages = []
-        current_text = text
-        
-        for pattern in page_patterns:
-            if re.search(pattern, current_text):
-                parts = re.split(pattern, current_text)
-                # 첫 번째 부분 (페이지 구분자 전)
-                if parts[0].strip():
-                    pages.append(parts[0].strip())
+        return [text[start:end] for start, end in self._split_page_spans(text)]
+    
+    def _split_page_spans(self, text: str) -> List[Tuple[int, int]]:
+        """페이지 구분자로 텍스트를 분리한 페이지별 (시작, 끝) 문자 오프셋 (앞뒤 공백 제외)"""
+        
+        # 구분자가 없는 텍스트(단일 페이지 OCR 결과 등)는 C 수준 부분 문자열 검색만으로 판별
+        if not any(literal in text for literal in self._PAGE_SPLIT_LITERALS):
+            return [(0, len(text))]
+        
+        # 구분자 종류별 위치 수집 (단일 스캔)
+        boundaries: Dict[str, List[Tuple[int, int]]] = {}
+        for match in self._PAGE_SPLIT_RE.finditer(text):
+            boundaries.setdefault(match.lastgroup, []).append(match.span())
+        
+        # 우선순위가 가장 높은 구분자 기준으로 분리
+        spans = []
+        for kind in self._PAGE_SPLIT_PRIORITY:
+            if kind in boundaries:
+                start = 0
+                for sep_start, sep_end in boundaries[kind]:
+                    self._append_page_span(spans, text, start, sep_start)
+                    start = sep_end
                 
-                # 나머지 부분들을 페이지로 처리
-                for i in range(1, len(parts), 2):  # 홀수 인덱스는 페이지 번호, 짝수는 내용
-                    if i + 1 < len(parts) and parts[i + 1].strip():
-                        pages.append(parts[i + 1].strip())
+                self._append_page_span(spans, text, start, len(text))
                 break
         
         # 페이지 구분자가 없으면 전체를 하나의 페이지로 처리
-        if not pages:
-            pages = [text]
+        if not spans:
+            spans = [(0, len(text))]
         
-        return pages
+        return spans
+    
+    @staticmethod
+    def _append_page_span(spans: List[Tuple[int, int]], text: str, start: int, end: int) -> None:
+        """앞뒤 공백을 제외한 페이지 범위를 추가 (빈 페이지는 제외)"""
+        
+        page_text = text[start:end]
+        stripped = page_text.lstrip()
+        start += len(page_text) - len(stripped)
+        end = start + len(stripped.rstrip())
+        
+        if start < end:
+            spans.append((start, end))
     
     def _calculate_final_confidence(self, text: str, doc_type: DocumentType) -> float:
         """최종 신뢰도 계산"""
@@ -803,19 +1654,34 @@ class DocumentTypeDetector:
         return confidence
     
     def get_detection_details(self, text: str) -> Dict[str, Any]:
-        """상세한 문서 타입 감지 정보 반환"""
+        """
+        상세한 문서 타입 감지 정보 반환
+        
+        Args:
+            text: 분석할 텍스트
+            
+        Returns:
+            {문서_타입_값: 감지_상세}
+        """
         
-        text_lower = text.lower()
         details = {}
         
-        for doc_type, keywords in self.type_keywords.items():
-            found_primary = [kw for kw in keywords["primary"] if kw.lower() in text_lower]
-            found_secondary = [kw for kw in keywords["secondary"] if kw.lower() in text_lower]
-            found_negative = [kw for kw in keywords["negative"] if kw.lower() in text_lower]
+        # 전체 키워드 출현 여부를 Aho-Corasick 한 번의 스캔으로 계산
+        keyword_counts = self._scan_keywords(text.lower())
+        
+        for _, type_value, keyword_set, primary, secondary, negative in self._type_table:
+            if keyword_set.isdisjoint(keyword_counts):
+                # 해당 타입 키워드가 하나도 없으면 카테고리별 확인 생략
+                found_primary, found_secondary, found_negative = [], [], []
+            else:
+                # 카테고리별 발견 키워드 (정의 순서 유지)
+                found_primary = [keyword for keyword_lower, keyword in primary if keyword_lower in keyword_counts]
+                found_secondary = [keyword for keyword_lower, keyword in secondary if keyword_lower in keyword_counts]
+                found_negative = [keyword for keyword_lower, keyword in negative if keyword_lower in keyword_counts]
             
             score = len(found_primary) * 3 + len(found_secondary) * 1 - len(found_negative) * 2
             
-            details[doc_type.value] = {
+            details[type_value] = {
                 "score": score,
                 "found_primary_keywords": found_primary,
                 "found_secondary_keywords": found_secondary,
@@ -833,15 +1699,43 @@ class PDFProcessor:
     파싱 엔진과 문서 타입 감지기를 결합한 통합 인터페이스
     """
     
-    def __init__(self, upstage_api_key: str = None, verbose: bool = False):
-        self.parser = PDFParsingEngine(upstage_api_key, verbose)
+    def __init__(
+        self, 
+        upstage_api_key: str = None, 
+        verbose: bool = False,
+        result_cache_size: int = 128,
+        concurrency_limit: int = 4,
+        disk_cache: bool = False
+    ):
+        """
+        Args:
+            upstage_api_key: Upstage API 키
+            verbose: 상세 로그 출력 여부
+            result_cache_size: (파일 내용 해시, 선호 엔진, 헤지 여부)별 처리 결과 캐시 크기 (0이면 캐시 사용 안 함)
+            concurrency_limit: 동시에 진행할 텍스트 추출 최대 개수 (Upstage 요청 제한/과부하 방지)
+            disk_cache: 추출 결과 디스크 캐시 사용 여부 (SMARTEXPENSE_CACHE_DIR에 저장)
+        """
+        self.parser = PDFParsingEngine(upstage_api_key, verbose, disk_cache=disk_cache)
         self.detector = DocumentTypeDetector(verbose)
         self.verbose = verbose
+        
+        # 동시 텍스트 추출 제한
+        self.concurrency_limit = concurrency_limit
+        self._extract_semaphore = asyncio.Semaphore(concurrency_limit)
+        
+        # 동일한 내용의 PDF 재처리 방지용 LRU 캐시 ((파일 해시, 선호 엔진, 헤지 여부) -> 처리 결과)
+        self.result_cache_size = result_cache_size
+        self._result_cache: "OrderedDict[Tuple[str, ExtractionEngine, bool], PDFProcessingResult]" = OrderedDict()
+    
+    async def aclose(self) -> None:
+        """처리기 리소스 정리"""
+        await self.parser.aclose()
     
     async def process_pdf(
         self, 
         file_path: str,
-        preferred_engine: ExtractionEngine = ExtractionEngine.UPSTAGE
+        preferred_engine: ExtractionEngine = ExtractionEngine.UPSTAGE,
+        hedged: bool = False
     ) -> PDFProcessingResult:
         """
         PDF 파일 완전 처리
@@ -849,28 +1743,40 @@ class PDFProcessor:
         Args:
             file_path: PDF 파일 경로
             preferred_engine: 선호하는 추출 엔진
+            hedged: Upstage/PyMuPDF 동시 실행 여부 (PDFParsingEngine.extract_text_from_pdf 참고)
             
         Returns:
             PDFProcessingResult 객체
         """
         
-        start_time = datetime.now()
-        file_info = get_file_info(file_path)
+        start_time = datetime.now()  # 결과 기록용 타임스탬프
+        start_counter = time.perf_counter()  # 처리 시간 측정용 (단조 시계)
         
-        # PDF 페이지 수 확인
-        try:
-            doc = fitz.open(file_path)
-            total_pages = len(doc)
-            doc.close()
-        except:
-            total_pages = 1  # 기본값
+        # PDF를 한 번만 읽고 해시하여 결과 캐시와 엔진 캐시가 함께 사용 (읽을 수 없으면 검증 단계에서 오류 처리)
+        pdf_bytes, pdf_digest = await asyncio.to_thread(self._read_and_hash, file_path)
+        
+        # 같은 내용의 PDF를 같은 추출 옵션으로 이미 처리했다면 추출/감지 전체 생략
+        cache_key = (pdf_digest, preferred_engine, hedged) if pdf_digest else None
+        if self.result_cache_size > 0 and cache_key is not None:
+            cached = self._result_cache.get(cache_key)
+            
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return await self._result_from_cache(cached, file_path, start_time, start_counter)
+        
+        # 블로킹 I/O는 별도 스레드에서 동시에 처리
+        # (PDF 페이지 수는 검증 단계에서 이미 PDF를 열어 확인하므로 따로 열지 않음)
+        validation_result, file_info = await asyncio.gather(
+            asyncio.to_thread(validate_pdf_file, file_path, deep=True),
+            asyncio.to_thread(get_file_info, file_path)
+        )
         
         # 결과 객체 초기화
         result = PDFProcessingResult(
             file_path=file_path,
             file_name=file_info["stem"],
             file_size_mb=file_info["size_mb"],
-            total_pages=total_pages,
+            total_pages=validation_result["info"].get("page_count", 1),
             processing_start_time=start_time,
             status=ProcessingStatus.PROCESSING
         )
@@ -879,51 +1785,56 @@ class PDFProcessor:
             if self.verbose:
                 logger.info(f"🚀 PDF 종합 처리 시작: {file_info['name']}")
             
-            # 1. 텍스트 추출
-            extracted_text, used_engine, parsing_time = await self.parser.extract_text_from_pdf(
-                file_path, preferred_engine
+            # 1. 텍스트 추출 (검증 결과를 넘겨 재검증 생략)
+            extracted_text, used_engine, parsing_time = await self._extract_text_limited(
+                file_path, preferred_engine, hedged, validation_result, pdf_bytes, pdf_digest
             )
             
             result.extraction_engines_used.append(used_engine)
             result.primary_engine = used_engine
             
-            # 2. 복수 문서 타입 감지
-            multiple_docs = self.detector.detect_multiple_documents(extracted_text)
+            # 2. 복수 문서 타입 감지 (대용량 텍스트 처리 중에도 다른 PDF의 I/O가 진행되도록 스레드에서 실행)
+            multiple_docs = await asyncio.to_thread(self.detector.detect_multiple_documents, extracted_text)
             
-            # 3. 문서 감지 결과 생성
+            # 3. 문서 감지 결과 생성 (문서별 텍스트는 전체 텍스트 내 오프셋으로만 보관)
+            result.extracted_text = extracted_text
             detections = []
-            for doc_type, confidence, page_range in multiple_docs:
-                # 해당 페이지 범위의 텍스트 추출
-                page_text = self._extract_text_for_page_range(extracted_text, page_range)
-                
+            best_detection = None  # 신뢰도가 가장 높은 문서 (동점이면 먼저 감지된 문서)
+            for detected in multiple_docs:
                 detection = DocumentDetection(
-                    document_type=doc_type,
-                    confidence=confidence,
-                    page_range=page_range,
-                    key_indicators=self._get_key_indicators(page_text, doc_type),
-                    extracted_data={"raw_text": page_text}
+                    document_type=detected.document_type,
+                    confidence=detected.confidence,
+                    page_range=detected.page_range,
+                    key_indicators=detected.key_indicators,  # 감지 단계에서 이미 계산된 핵심 키워드
+                    text_spans=detected.text_spans  # 감지 단계에서 분리한 페이지별 텍스트 위치
                 )
                 detections.append(detection)
+                
+                if best_detection is None or detection.confidence > best_detection.confidence:
+                    best_detection = detection
             
             # 감지된 문서가 없으면 단일 문서로 처리
             if not detections:
-                doc_type, confidence = self.detector.detect_document_type(extracted_text)
+                doc_type, confidence, keyword_counts = self.detector._detect_with_keywords(extracted_text)
                 detection = DocumentDetection(
                     document_type=doc_type,
                     confidence=confidence,
                     page_range=(1, result.total_pages or 1),
-                    key_indicators=self._get_key_indicators(extracted_text, doc_type),
-                    extracted_data={"raw_text": extracted_text}
+                    key_indicators=self.detector.get_key_indicators(doc_type, keyword_counts),
+                    text_spans=[(0, len(extracted_text))]
                 )
                 detections = [detection]
+                best_detection = detection
             
             result.detected_documents = detections
             # 주 문서 타입은 첫 번째 또는 가장 신뢰도가 높은 문서로 설정
-            result.primary_document_type = max(detections, key=lambda x: x.confidence).document_type
+            result.primary_document_type = best_detection.document_type
             result.status = ProcessingStatus.COMPLETED
             
             if self.verbose:
-                logger.info(f"✅ 처리 완료: {doc_type.value} (엔진: {used_engine.value})")
+                # use_enum_values 설정으로 문서 타입이 문자열로 저장되어 있을 수 있음
+                primary_type = getattr(best_detection.document_type, "value", best_detection.document_type)
+                logger.info(f"✅ 처리 완료: {primary_type} (엔진: {used_engine.value})")
             
         except Exception as e:
             result.add_error(f"처리 실패: {str(e)}")
@@ -932,39 +1843,75 @@ class PDFProcessor:
             if self.verbose:
                 logger.error(f"❌ PDF 처리 실패: {str(e)}")
         
-        # 처리 시간 계산
-        end_time = datetime.now()
-        result.processing_end_time = end_time
-        result.processing_duration_seconds = (end_time - start_time).total_seconds()
+        # 처리 시간 계산 (종료 시각은 단조 시계로 잰 처리 시간에서 산출해 두 값이 항상 일치)
+        result.processing_duration_seconds = time.perf_counter() - start_counter
+        result.processing_end_time = start_time + timedelta(seconds=result.processing_duration_seconds)
+        
+        # 성공한 결과만 캐시 (호출자가 결과를 수정해도 캐시에 영향 없도록 복사본 저장)
+        if self.result_cache_size > 0 and cache_key is not None and result.status == ProcessingStatus.COMPLETED:
+            self._result_cache[cache_key] = result.model_copy(deep=True)
+            if len(self._result_cache) > self.result_cache_size:
+                self._result_cache.popitem(last=False)
         
         return result
     
-    def _extract_text_for_page_range(self, full_text: str, page_range: Tuple[int, int]) -> str:
-        """페이지 범위에 해당하는 텍스트 추출"""
-        start_page, end_page = page_range
-        
-        # 페이지 구분자로 분리
-        pages = self.detector._split_text_by_pages(full_text)
-        
-        # 인덱스 조정 (1-based -> 0-based)
-        start_idx = max(0, start_page - 1)
-        end_idx = min(len(pages), end_page)
-        
-        # 해당 범위의 페이지들 결합
-        selected_pages = pages[start_idx:end_idx]
-        return "\n\n".join(selected_pages)
+    async def _extract_text_limited(
+        self, 
+        file_path: str, 
+        preferred_engine: ExtractionEngine, 
+        hedged: bool,
+        validation_result: Optional[Dict[str, Any]] = None,
+        pdf_bytes: Optional[bytes] = None,
+        pdf_digest: Optional[str] = None
+    ) -> Tuple[str, ExtractionEngine, float]:
+        """동시 실행 수 제한 안에서 텍스트 추출"""
+        
+        async with self._extract_semaphore:
+            return await self.parser.extract_text_from_pdf(
+                file_path, 
+                preferred_engine, 
+                hedged=hedged, 
+                validation_result=validation_result,
+                pdf_bytes=pdf_bytes,
+                pdf_digest=pdf_digest
+            )
     
-    def _get_key_indicators(self, text: str, doc_type: DocumentType) -> List[str]:
-        """문서 타입 감지에 사용된 핵심 키워드 반환"""
+    @staticmethod
+    def _read_and_hash(file_path: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """파일 내용과 내용 해시 (읽을 수 없으면 (None, None))"""
         
-        details = self.detector.get_detection_details(text)
-        type_details = details.get(doc_type.value, {})
+        try:
+            pdf_bytes = Path(file_path).read_bytes()
+        except OSError:
+            return None, None
+        return pdf_bytes, hash_bytes(pdf_bytes)
+    
+    async def _result_from_cache(
+        self, 
+        cached: PDFProcessingResult, 
+        file_path: str, 
+        start_time: datetime,
+        start_counter: float
+    ) -> PDFProcessingResult:
+        """캐시된 처리 결과를 현재 파일 정보와 처리 시간으로 갱신한 복사본 반환"""
         
-        indicators = []
-        indicators.extend(type_details.get("found_primary_keywords", []))
-        indicators.extend(type_details.get("found_secondary_keywords", [])[:3])  # 최대 3개
+        file_info = await asyncio.to_thread(get_file_info, file_path)
         
-        return indicators[:5]  # 최대 5개 반환
+        if self.verbose:
+            logger.info(f"♻️ 동일한 PDF 처리 결과 재사용: {file_info['name']}")
+        
+        duration = time.perf_counter() - start_counter
+        return cached.model_copy(
+            deep=True,
+            update={
+                "file_path": file_path,
+                "file_name": file_info["stem"],
+                "file_size_mb": file_info["size_mb"],
+                "processing_start_time": start_time,
+                "processing_end_time": start_time + timedelta(seconds=duration),
+                "processing_duration_seconds": duration
+            }
+        )
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """성능 요약 정보 반환"""
@@ -973,6 +1920,7 @@ class PDFProcessor:
         
         return {
             "engine_statistics": engine_stats,
+            "text_probe_statistics": self.parser.get_probe_statistics(),
             "supported_document_types": [dt.value for dt in DocumentType],
             "available_engines": [engine.value for engine in ExtractionEngine]
         }
\ No newline at end of file
@@ -5,15 +5,19 @@ Business Settlement PDF 분석 시스템 - 유틸리티 함수들
 """
 
 import json
-import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
+import orjson
 from rich.console import Console
 
 # Rich 콘솔 객체
 console = Console()
 
+# 가벼운 PDF 검증 시 읽는 앞/뒤 바이트 수 (PDF 헤더는 파일 앞 1024바이트 안에 위치)
+_PDF_PROBE_BYTES = 1024
+
 
 def save_json_result(data: Any, file_path: str) -> None:
     """
@@ -30,15 +34,22 @@ def save_json_result(data: Any, file_path: str) -> None:
     else:
         data_dict = data
     
-    # JSON 저장
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(
+    # JSON 저장 (orjson으로 직렬화, 지원하지 않는 값이 있으면 표준 json으로 대체)
+    try:
+        data_bytes = orjson.dumps(
+            data_dict,
+            default=_json_serializer,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    except TypeError:
+        data_bytes = json.dumps(
             data_dict,
-            f,
             ensure_ascii=False,
             indent=2,
             default=_json_serializer
-        )
+        ).encode('utf-8')
+    
+    Path(file_path).write_bytes(data_bytes)
 
 
 def _json_serializer(obj: Any) -> Any:
@@ -68,13 +79,8 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # 연속된 공백을 하나로 변경
-    text = re.sub(r'\s+', ' ', text)
-    
-    # 앞뒤 공백 제거
-    text = text.strip()
-    
-    return text
+    # 연속된 공백을 하나로 변경하고 앞뒤 공백 제거 (정규식 없이 C 수준 분리/결합)
+    return ' '.join(text.split())
 
 
 def get_file_info(file_path: str) -> Dict[str, Any]:
@@ -90,30 +96,68 @@ def get_file_info(file_path: str) -> Dict[str, Any]:
     
     file_path_obj = Path(file_path)
     
-    if not file_path_obj.exists():
+    try:
+        stat = file_path_obj.stat()
+    except OSError:
         return {"error": "파일이 존재하지 않습니다"}
     
-    stat = file_path_obj.stat()
+    # stat 값이 캐시 키에 포함되므로 파일이 바뀌면 자동으로 다시 계산됨
+    return dict(_get_file_info_cached(
+        str(file_path_obj.absolute()), stat.st_size, stat.st_mtime, stat.st_ctime
+    ))
+
+
+@lru_cache(maxsize=256)
+def _get_file_info_cached(absolute_path: str, size_bytes: int, mtime: float, ctime: float) -> Dict[str, Any]:
+    """(경로, 크기, 수정/생성 시각) 기준으로 메모이즈된 파일 정보 (호출자는 복사본 사용)"""
+    
+    file_path_obj = Path(absolute_path)
     
     return {
         "name": file_path_obj.name,
         "stem": file_path_obj.stem,
         "suffix": file_path_obj.suffix,
-        "size_bytes": stat.st_size,
-        "size_mb": round(stat.st_size / (1024 * 1024), 2),
-        "created_time": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-        "modified_time": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-        "absolute_path": str(file_path_obj.absolute()),
+        "size_bytes": size_bytes,
+        "size_mb": round(size_bytes / (1024 * 1024), 2),
+        "created_time": datetime.fromtimestamp(ctime).isoformat(),
+        "modified_time": datetime.fromtimestamp(mtime).isoformat(),
+        "absolute_path": absolute_path,
         "is_pdf": file_path_obj.suffix.lower() == '.pdf'
     }
 
 
-def validate_pdf_file(file_path: str) -> Dict[str, Any]:
+def count_pdf_pages(file_path: str, default: int = 1) -> int:
+    """
+    PDF 페이지 수 조회
+    
+    Args:
+        file_path: PDF 파일 경로
+        default: 파일을 열 수 없을 때 반환할 기본값
+        
+    Returns:
+        페이지 수
+    """
+    
+    try:
+        import fitz  # PyMuPDF
+        
+        doc = fitz.open(file_path)
+        try:
+            return len(doc)
+        finally:
+            doc.close()
+    except Exception:
+        return default
+
+
+def validate_pdf_file(file_path: str, deep: bool = True) -> Dict[str, Any]:
     """
     PDF 파일 유효성 검증
     
     Args:
         file_path: PDF 파일 경로
+        deep: True면 PyMuPDF로 PDF를 열어 페이지 수/암호화/메타데이터까지 확인
+              (False면 헤더/트레일러 바이트만 확인하는 가벼운 검증)
         
     Returns:
         검증 결과
@@ -140,10 +184,30 @@ def validate_pdf_file(file_path: str) -> Dict[str, Any]:
             return result
         
         # 파일 크기 확인
-        file_size_mb = file_path_obj.stat().st_size / (1024 * 1024)
+        file_size = file_path_obj.stat().st_size
+        file_size_mb = file_size / (1024 * 1024)
         if file_size_mb > 50:  # 50MB 제한
             result["warnings"].append(f"파일 크기가 큽니다: {file_size_mb:.1f}MB")
         
+        # 가벼운 검증: PDF 헤더(%PDF-)와 트레일러(%%EOF) 바이트만 확인
+        if not deep:
+            with open(file_path_obj, 'rb') as f:
+                head = f.read(_PDF_PROBE_BYTES)
+                f.seek(max(0, file_size - _PDF_PROBE_BYTES))
+                tail = f.read()
+            
+            if b'%PDF-' not in head:
+                result["error"] = "PDF 파일 헤더가 없습니다"
+                return result
+            
+            if b'%%EOF' not in tail:
+                # PyMuPDF는 트레일러가 손상된 PDF도 복구해서 열 수 있으므로 경고만 남김
+                result["warnings"].append("PDF 트레일러(%%EOF)가 없습니다")
+            
+            result["info"] = {"file_size_mb": round(file_size_mb, 2)}
+            result["is_valid"] = True
+            return result
+        
         # PDF 파일 구조 확인 (PyMuPDF 사용)
         try:
             import fitz  # PyMuPDF
@@ -21,8 +21,14 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from datetime import datetime
+from enum import Enum
 import traceback
 
+try:
+    import uvloop  # 선택적 고속 이벤트 루프 (Linux/macOS)
+except ImportError:
+    uvloop = None
+
 # 환경 변수 로드
 from dotenv import load_dotenv
 load_dotenv()
@@ -35,7 +41,7 @@ from app.models import (
     ProcessingStatus,
     PDFProcessingResult
 )
-from app.utils import console, save_json_result
+from app.utils import console, save_json_result, get_file_info, count_pdf_pages
 from app.data_extractor import DataExtractor
 
 # 지원하는 문서 타입
@@ -57,6 +63,15 @@ SUPPORTED_ENGINES = {
     "tesseract": "Tesseract OCR (최후 수단)"
 }
 
+# 처리 상태별 표시 문구
+STATUS_LABELS = {
+    ProcessingStatus.COMPLETED: "성공",
+    ProcessingStatus.FAILED: "실패",
+    ProcessingStatus.PARTIAL: "부분",
+    ProcessingStatus.PROCESSING: "처리중",
+    ProcessingStatus.PENDING: "대기"
+}
+
 
 @click.command()
 @click.option(
@@ -88,6 +103,11 @@ SUPPORTED_ENGINES = {
     default=4,
     help='최대 워커 수 (병렬 처리 시, 기본값: 4)'
 )
+@click.option(
+    '--cache',
+    is_flag=True,
+    help='Upstage 응답/추출 결과 디스크 캐시 사용 (동일 PDF 재처리 시 API 호출/OCR 생략)'
+)
 @click.option(
     '--verbose', '-v',
     is_flag=True,
@@ -99,6 +119,7 @@ def main(
     output_dir: str | None,
     parallel: bool,
     max_workers: int,
+    cache: bool,
     verbose: bool
 ):
     """
@@ -131,9 +152,10 @@ def main(
     Path(output_dir).mkdir(exist_ok=True)
     
     try:
-        # 비동기 처리 실행
-        asyncio.run(process_files(
-            files, engine, output_dir, parallel, max_workers, verbose
+        # 비동기 처리 실행 (uvloop가 설치되어 있으면 libuv 기반 이벤트 루프 사용)
+        run = uvloop.run if uvloop is not None else asyncio.run
+        run(process_files(
+            files, engine, output_dir, parallel, max_workers, cache, verbose
         ))
         
     except Exception as e:
@@ -150,6 +172,7 @@ async def process_files(
     output_dir: str,
     parallel: bool,
     max_workers: int,
+    cache: bool,
     verbose: bool
 ):
     """파일 처리 메인 로직"""
@@ -166,22 +189,30 @@ async def process_files(
     if engine != 'upstage':
         upstage_api_key = None
     
-    processor = PDFProcessor(upstage_api_key=upstage_api_key, verbose=verbose)
+    processor = PDFProcessor(
+        upstage_api_key=upstage_api_key,
+        verbose=verbose,
+        concurrency_limit=max(1, max_workers),
+        disk_cache=cache
+    )
     extractor = DataExtractor(verbose=verbose)
     
     selected_engine = ExtractionEngine(engine)
     results = []
     
-    if parallel and len(files) > 1:
-        # 병렬 처리
-        results = await process_files_parallel(
-            files, processor, extractor, selected_engine, max_workers, verbose
-        )
-    else:
-        # 순차 처리
-        results = await process_files_sequential(
-            files, processor, extractor, selected_engine, verbose
-        )
+    try:
+        if parallel and len(files) > 1:
+            # 병렬 처리
+            results = await process_files_parallel(
+                files, processor, extractor, selected_engine, max_workers, verbose
+            )
+        else:
+            # 순차 처리
+            results = await process_files_sequential(
+                files, processor, extractor, selected_engine, verbose
+            )
+    finally:
+        await processor.aclose()
     
     # 결과 저장 및 출력
     await save_and_display_results(results, output_dir, verbose)
@@ -200,11 +231,7 @@ async def process_files_parallel(
     console.print(f"[cyan]병렬 처리 모드 (최대 {max_workers}개 동시 처리)[/cyan]")
     
     semaphore = asyncio.Semaphore(max_workers)
-    results = []
-    
-    async def process_single_file(file_path: str):
-        async with semaphore:
-            return await process_single_pdf(file_path, processor, extractor, engine, verbose)
+    completed = 0
     
     with Progress(
         SpinnerColumn(),
@@ -216,17 +243,25 @@ async def process_files_parallel(
         
         task = progress.add_task(f"{len(files)}개 파일 처리 중...", total=len(files))
         
-        tasks = [process_single_file(file_path) for file_path in files]
-        
-        for completed_task in asyncio.as_completed(tasks):
-            result = await completed_task
-            results.append(result)
+        async def process_single_file(file_path: str):
+            nonlocal completed
+            
+            async with semaphore:
+                result = await process_single_pdf(file_path, processor, extractor, engine, verbose)
+            
+            # 완료되는 대로 진행 상황 갱신
+            completed += 1
             progress.advance(task, 1)
             
             if result.status == ProcessingStatus.COMPLETED:
-                progress.update(task, description=f"성공 {len(results)}/{len(files)} 완료")
+                progress.update(task, description=f"성공 {completed}/{len(files)} 완료")
             else:
-                progress.update(task, description=f"경고 {len(results)}/{len(files)} 처리됨")
+                progress.update(task, description=f"경고 {completed}/{len(files)} 처리됨")
+            
+            return result
+        
+        # gather는 입력 순서대로 결과를 반환하므로 결과 테이블 순서가 항상 일정
+        results = await asyncio.gather(*(process_single_file(file_path) for file_path in files))
     
     return results
 
@@ -274,20 +309,28 @@ async def process_single_pdf(
         # PDF 파싱 및 문서 타입 감지
         result = await processor.process_pdf(file_path, engine)
         
-        # 데이터 추출 (각 감지된 문서별로)
+        # 데이터 추출 대상 (텍스트가 있는 감지 문서)
+        targets = []
         for detection in result.detected_documents:
+            raw_text = result.get_document_text(detection)
+            if not raw_text:
+                continue
+            
+            # 결과 JSON에 문서별 원문 텍스트 보관
+            detection.extracted_data["raw_text"] = raw_text
+            
             if detection.document_type != DocumentType.UNKNOWN:
-                # 텍스트에서 구조화된 데이터 추출
-                raw_text = detection.extracted_data.get("raw_text", "")
-                if raw_text:
-                    extracted_data = extractor.extract_data(
-                        raw_text, 
-                        detection.document_type, 
-                        engine
-                    )
-                    # 기존 raw_text는 유지하고 새로 추출된 데이터만 업데이트
-                    for key, value in extracted_data.items():
-                        detection.extracted_data[key] = value
+                targets.append((detection, raw_text))
+        
+        # 문서별 정규식 추출은 서로 독립적이므로 스레드에서 동시에 실행 (이벤트 루프 차단 방지)
+        extracted_results = await asyncio.gather(*(
+            asyncio.to_thread(extractor.extract_data, raw_text, detection.document_type, engine)
+            for detection, raw_text in targets
+        ))
+        
+        for (detection, _), extracted_data in zip(targets, extracted_results):
+            # 기존 raw_text는 유지하고 새로 추출된 데이터만 업데이트
+            detection.extracted_data.update(extracted_data)
         
         return result
         
@@ -295,32 +338,17 @@ async def process_single_pdf(
         # 자세한 오류 정보 출력 (디버깅용)
         if verbose:
             console.print(f"[red]상세 오류: {str(e)}[/red]")
-            import traceback
             console.print(f"[red]스택 트레이스: {traceback.format_exc()}[/red]")
         
-        # 파일 정보 시도
-        try:
-            from app.utils import get_file_info
-            file_info = get_file_info(file_path)
-            file_size_mb = file_info.get("size_mb", 0.0)
-            
-            # PDF 페이지 수 확인 시도
-            try:
-                import fitz
-                doc = fitz.open(file_path)
-                total_pages = len(doc)
-                doc.close()
-            except:
-                total_pages = 1  # 기본값을 1로 설정
-        except:
-            file_size_mb = 1.0
-            total_pages = 1
+        # 파일 정보 시도 (디스크 I/O는 다른 파일 처리를 막지 않도록 스레드에서 실행)
+        file_size_mb, total_pages = await asyncio.to_thread(_probe_failed_file, file_path)
         
         # 에러 결과 생성
+        file_stem = Path(file_path).stem
         try:
             error_result = PDFProcessingResult(
                 file_path=file_path,
-                file_name=Path(file_path).stem,
+                file_name=file_stem,
                 file_size_mb=file_size_mb,
                 total_pages=total_pages,
                 status=ProcessingStatus.FAILED
@@ -331,20 +359,32 @@ async def process_single_pdf(
             # PDFProcessingResult 생성도 실패한 경우
             if verbose:
                 console.print(f"[red]모델 생성 오류: {str(model_error)}[/red]")
-            # 최소한의 결과 반환
-            class SimpleResult:
-                def __init__(self):
-                    self.file_path = file_path
-                    self.file_name = Path(file_path).stem
-                    self.file_size_mb = 1.0
-                    self.total_pages = 1
-                    self.status = ProcessingStatus.FAILED
-                    self.errors = [f"처리 실패: {str(e)}"]
-                    self.detected_documents = []
-                    self.processing_duration_seconds = 0.0
-                    self.primary_engine = ExtractionEngine.PYMUPDF
-            
-            return SimpleResult()
+            # 검증 없이 최소한의 결과 생성 (model_construct는 실패하지 않음, 나머지 필드는 기본값)
+            return PDFProcessingResult.model_construct(
+                file_path=file_path,
+                file_name=file_stem,
+                file_size_mb=1.0,
+                total_pages=1,
+                status=ProcessingStatus.FAILED,
+                errors=[f"처리 실패: {str(e)}"],
+                primary_engine=ExtractionEngine.PYMUPDF
+            )
+
+
+def _probe_failed_file(file_path: str) -> tuple[float, int]:
+    """처리에 실패한 파일의 크기(MB)와 페이지 수 조회 (조회 실패 시 기본값)"""
+    
+    try:
+        file_info = get_file_info(file_path)
+        file_size_mb = file_info.get("size_mb", 0.0)
+        
+        # PDF 페이지 수 확인 시도 (열 수 없으면 기본값 1)
+        total_pages = count_pdf_pages(file_path, default=1)
+    except Exception:
+        file_size_mb = 1.0
+        total_pages = 1
+    
+    return file_size_mb, total_pages
 
 
 async def save_and_display_results(
@@ -355,27 +395,34 @@ async def save_and_display_results(
     """결과 저장 및 화면 출력"""
     
     successful_results = [r for r in results if r.status == ProcessingStatus.COMPLETED]
-    failed_results = [r for r in results if r.status == ProcessingStatus.FAILED]
     
     # 파일별 JSON 저장
     saved_files = []
     
+    output_path = Path(output_dir)
+    json_paths = []
     for result in successful_results:
-        try:
-            # 수행시간을 포함한 JSON 파일 경로 생성
-            duration_str = f"{result.processing_duration_seconds:.2f}s"
-            timestamp = result.processing_start_time.strftime("%Y%m%d_%H%M%S")
-            json_filename = f"{result.file_name}_{timestamp}_{duration_str}.json"
-            json_path = Path(output_dir) / json_filename
-            
-            # JSON 저장
-            save_json_result(result.model_dump(), str(json_path))
-            result.results_saved_to = str(json_path)
-            saved_files.append(str(json_path))
-            
-        except Exception as e:
+        # 수행시간을 포함한 JSON 파일 경로 생성
+        duration_str = f"{result.processing_duration_seconds:.2f}s"
+        timestamp = result.processing_start_time.strftime("%Y%m%d_%H%M%S")
+        json_filename = f"{result.file_name}_{timestamp}_{duration_str}.json"
+        json_paths.append(str(output_path / json_filename))
+    
+    # JSON 직렬화/쓰기는 파일별로 독립적이므로 스레드에서 동시에 실행
+    save_outcomes = await asyncio.gather(
+        *(asyncio.to_thread(save_json_result, result, json_path)
+          for result, json_path in zip(successful_results, json_paths)),
+        return_exceptions=True
+    )
+    
+    for result, json_path, outcome in zip(successful_results, json_paths, save_outcomes):
+        if isinstance(outcome, Exception):
             if verbose:
-                console.print(f"[red]JSON 저장 실패 ({result.file_name}): {e}[/red]")
+                console.print(f"[red]JSON 저장 실패 ({result.file_name}): {outcome}[/red]")
+            continue
+        
+        result.results_saved_to = json_path
+        saved_files.append(json_path)
     
     # 결과 테이블 출력
     display_results_table(results)
@@ -403,18 +450,12 @@ def display_results_table(results: list[PDFProcessingResult]):
     table.add_column("오류", style="red", width=30)
     
     for result in results:
-        status_emoji = {
-            ProcessingStatus.COMPLETED: "성공",
-            ProcessingStatus.FAILED: "실패", 
-            ProcessingStatus.PARTIAL: "부분",
-            ProcessingStatus.PROCESSING: "처리중",
-            ProcessingStatus.PENDING: "대기"
-        }.get(result.status, "알수없음")
+        status_emoji = STATUS_LABELS.get(result.status, "알수없음")
         
         # 감지된 문서 정보
         if result.detected_documents:
             first_doc = result.detected_documents[0]
-            doc_type = first_doc.document_type.value if hasattr(first_doc.document_type, 'value') else str(first_doc.document_type)
+            doc_type = _enum_value(first_doc.document_type)
             confidence = f"{first_doc.confidence:.1%}"
         else:
             doc_type = "없음"
@@ -426,24 +467,41 @@ def display_results_table(results: list[PDFProcessingResult]):
             error_msg = result.errors[-1][:50] + "..." if len(result.errors[-1]) > 50 else result.errors[-1]
         
         table.add_row(
-            Path(result.file_path).name,
+            os.path.basename(result.file_path),  # 행마다 Path 객체를 만들지 않음
             f"{status_emoji}",
             doc_type,
             confidence,
             f"{result.processing_duration_seconds:.1f}s",
-            result.primary_engine.value if result.primary_engine and hasattr(result.primary_engine, 'value') else (str(result.primary_engine) if result.primary_engine else "N/A"),
+            _enum_value(result.primary_engine),
             error_msg
         )
     
     console.print(table)
 
 
+def _enum_value(value, default: str = "N/A") -> str:
+    """Enum이면 값, None이면 기본값, 그 외에는 문자열로 변환"""
+    
+    if value is None:
+        return default
+    return value.value if isinstance(value, Enum) else str(value)
+
+
 def display_final_summary(results: list[PDFProcessingResult], saved_files: list[str]):
     """최종 요약 정보 표시"""
     
     total_files = len(results)
-    successful_files = len([r for r in results if r.status == ProcessingStatus.COMPLETED])
-    failed_files = len([r for r in results if r.status == ProcessingStatus.FAILED])
+    
+    # 성공/실패 수, 총 처리 시간, 총 문서 수를 한 번의 순회로 집계
+    successful_files = failed_files = total_documents = 0
+    total_time = 0.0
+    for r in results:
+        total_time += r.processing_duration_seconds
+        total_documents += len(r.detected_documents)
+        if r.status == ProcessingStatus.COMPLETED:
+            successful_files += 1
+        elif r.status == ProcessingStatus.FAILED:
+            failed_files += 1
     
     success_rate = successful_files / total_files if total_files > 0 else 0
     
@@ -455,13 +513,9 @@ def display_final_summary(results: list[PDFProcessingResult], saved_files: list[
     else:
         rate_color = "red"
     
-    # 총 처리 시간
-    total_time = sum(r.processing_duration_seconds for r in results)
+    # 평균 처리 시간
     avg_time = total_time / total_files if total_files > 0 else 0
     
-    # 총 문서 수
-    total_documents = sum(len(r.detected_documents) for r in results)
-    
     console.print()
     console.print(Panel(
         f"[bold {rate_color}]전체 성공률: {success_rate:.1%}[/bold {rate_color}]\n"
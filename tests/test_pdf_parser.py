@@ -0,0 +1,32 @@
+"""
+Business Settlement PDF 분석 시스템 - 페이지 분리 회귀 테스트
+"""
+
+import pytest
+
+# PDF/HTTP 의존성이 설치되지 않은 환경에서는 건너뜀
+for module_name in ("fitz", "PIL", "httpx", "orjson", "pydantic"):
+    pytest.importorskip(module_name)
+
+from app.pdf_parser import DocumentTypeDetector
+
+
+@pytest.fixture
+def detector():
+    return DocumentTypeDetector()
+
+
+def test_split_form_feed_keeps_every_page(detector):
+    """폼 피드 구분 텍스트에서 모든 페이지 유지 (예전에는 한 페이지씩 건너뛰며 누락)"""
+    assert detector._split_text_by_pages("first\fsecond\fthird") == ["first", "second", "third"]
+
+
+def test_split_page_markers(detector):
+    """'--- 페이지 N ---' 구분자는 제거하고 페이지 본문만 반환"""
+    text = "--- 페이지 1 ---\nA\n\n--- 페이지 2 ---\nB"
+    assert detector._split_text_by_pages(text) == ["A", "B"]
+
+
+def test_split_without_separator(detector):
+    """구분자가 없으면 전체 텍스트를 그대로 단일 페이지로 처리"""
+    assert detector._split_text_by_pages("  single page  ") == ["  single page  "]